@@ -0,0 +1,128 @@
+"""Checks on the distribution of a column's values.
+
+Each check summarises the column with a mergeable accumulator from
+`iudex.sketches`, so it needs a single pass over the data and memory which
+does not grow with the number of rows. Bounds are inclusive. A check
+passes if its statistic is undefined, such as the mean of a column with
+no non-null values.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+from .checks import AggregateCheck
+from .sketches import DistinctCounter, Moments, NullCounter, Quantiles
+
+
+def _validate_bounds(lower: float | None, upper: float | None) -> None:
+    if lower is None and upper is None:
+        raise ValueError("At least one of lower or upper must be given.")
+    if lower is not None and upper is not None and lower > upper:
+        raise ValueError("Lower bound must not be greater than upper bound.")
+
+
+def _within(value: float | None, lower: float | None, upper: float | None) -> bool:
+    if value is None:
+        return True
+    if lower is not None and not value >= lower:
+        return False
+    return upper is None or value <= upper
+
+
+@dataclasses.dataclass(frozen=True)
+class Mean(AggregateCheck[Moments]):
+    """The mean of the non-null values is within bounds."""
+
+    lower: float | None = None
+    upper: float | None = None
+
+    def __post_init__(self) -> None:
+        _validate_bounds(self.lower, self.upper)
+
+    def accumulator(self) -> Moments:
+        return Moments()
+
+    def passes(self, accumulator: Moments) -> bool:
+        return _within(accumulator.mean, self.lower, self.upper)
+
+
+@dataclasses.dataclass(frozen=True)
+class StandardDeviation(AggregateCheck[Moments]):
+    """The population standard deviation of the non-null values is within
+    bounds."""
+
+    lower: float | None = None
+    upper: float | None = None
+
+    def __post_init__(self) -> None:
+        _validate_bounds(self.lower, self.upper)
+
+    def accumulator(self) -> Moments:
+        return Moments()
+
+    def passes(self, accumulator: Moments) -> bool:
+        return _within(accumulator.standard_deviation, self.lower, self.upper)
+
+
+@dataclasses.dataclass(frozen=True)
+class Quantile(AggregateCheck[Quantiles]):
+    """The ``q``-th quantile of the non-null values is within bounds.
+
+    The quantile is estimated with a KLL sketch of size ``k``.
+    """
+
+    q: float
+    lower: float | None = None
+    upper: float | None = None
+    k: int = 200
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+        _validate_bounds(self.lower, self.upper)
+
+    def accumulator(self) -> Quantiles:
+        return Quantiles(self.k)
+
+    def passes(self, accumulator: Quantiles) -> bool:
+        return _within(accumulator.quantile(self.q), self.lower, self.upper)
+
+
+@dataclasses.dataclass(frozen=True)
+class NullFraction(AggregateCheck[NullCounter]):
+    """The fraction of values which are null is within bounds."""
+
+    lower: float | None = None
+    upper: float | None = None
+
+    def __post_init__(self) -> None:
+        _validate_bounds(self.lower, self.upper)
+
+    def accumulator(self) -> NullCounter:
+        return NullCounter()
+
+    def passes(self, accumulator: NullCounter) -> bool:
+        return _within(accumulator.null_fraction, self.lower, self.upper)
+
+
+@dataclasses.dataclass(frozen=True)
+class DistinctCount(AggregateCheck[DistinctCounter]):
+    """The number of distinct non-null values is within bounds.
+
+    The count is estimated with a HyperLogLog sketch, whose relative error
+    is roughly ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    lower: float | None = None
+    upper: float | None = None
+    precision: int = 14
+
+    def __post_init__(self) -> None:
+        _validate_bounds(self.lower, self.upper)
+
+    def accumulator(self) -> DistinctCounter:
+        return DistinctCounter(self.precision)
+
+    def passes(self, accumulator: DistinctCounter) -> bool:
+        return _within(accumulator.distinct_count, self.lower, self.upper)
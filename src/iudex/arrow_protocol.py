@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any, Protocol, Union
+
+
+class ArrowStreamExportable(Protocol):
+    """
+    An object exporting a stream of record batches through the Arrow
+    PyCapsule interface.
+
+    See https://arrow.apache.org/docs/format/CDataInterface/PyCapsuleInterface.html.
+    """
+
+    def __arrow_c_stream__(self, requested_schema: Any | None = None) -> Any:
+        """
+        Export the object as an ``ArrowArrayStream`` wrapped in a PyCapsule
+        named ``"arrow_array_stream"``.
+        """
+        ...
+
+
+class ArrowArrayExportable(Protocol):
+    """
+    An object exporting a single struct array or record batch through the
+    Arrow PyCapsule interface.
+
+    See https://arrow.apache.org/docs/format/CDataInterface/PyCapsuleInterface.html.
+    """
+
+    def __arrow_c_array__(
+        self,
+        requested_schema: Any | None = None,
+    ) -> tuple[Any, Any]:
+        """
+        Export the object as a pair of PyCapsules named ``"arrow_schema"``
+        and ``"arrow_array"``.
+        """
+        ...
+
+
+ArrowExportable = Union[ArrowStreamExportable, ArrowArrayExportable]
@@ -1,26 +1,68 @@
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import dataclasses
 import functools
 from abc import ABC, abstractmethod
-from collections.abc import Set
-from typing import Any
+from collections.abc import Iterator, Set
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import pyarrow
-import pyarrow.compute
-import pyarrow.acero
-import pyarrow.dataset
+
+# `pyarrow.compute`, `pyarrow.acero` and `pyarrow.dataset` are slow to import,
+# so they are only imported by the checks which use them.
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow.acero
+    import pyarrow.compute
+    import pyarrow.dataset
+
+# The memory pool which checks allocate from, set by validation. None is
+# the default memory pool.
+_MEMORY_POOL: contextvars.ContextVar[pyarrow.MemoryPool | None] = (
+    contextvars.ContextVar("iudex_memory_pool", default=None)
+)
+
+
+def _memory_pool() -> pyarrow.MemoryPool | None:
+    return _MEMORY_POOL.get()
+
+
+@contextlib.contextmanager
+def _use_memory_pool(pool: pyarrow.MemoryPool | None) -> Iterator[None]:
+    """Make checks allocate from ``pool`` in the current context.
+
+    Threads do not inherit the context, so functions run in other threads
+    should be run in a copy of it, with `contextvars.copy_context`.
+    """
+    token = _MEMORY_POOL.set(pool)
+    try:
+        yield
+    finally:
+        _MEMORY_POOL.reset(token)
 
 
 class Check(ABC):
     @abstractmethod
     def __call__(
         self,
-        data: pyarrow.dataset.Dataset,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
         column: str,
     ) -> pyarrow.ChunkedArray:
         ...
 
+    def is_elementwise(self) -> bool:
+        """Whether each value is checked independently of all other values."""
+        return False
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        """Check a single batch of values, returning a boolean mask.
+
+        Only elementwise checks support this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} is not elementwise.")
+
     def __and__(self, other: Check) -> Check:
         return All(frozenset({self, other}))
 
@@ -28,184 +70,1232 @@ class Check(ABC):
         return Any_(frozenset({self, other}))
 
 
+class ElementwiseCheck(Check):
+    """A check whose result for each value depends on that value alone.
+
+    Elementwise checks are evaluated one batch at a time, so validation can
+    run them all in a single pass over the data.
+    """
+
+    @abstractmethod
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        ...
+
+    def is_elementwise(self) -> bool:
+        return True
+
+    def __call__(
+        self,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
+        column: str,
+    ) -> pyarrow.ChunkedArray:
+        return _evaluate_batches(self, data, column)
+
+
+class Accumulator(ABC):
+    """A summary of a column which is built up one batch at a time.
+
+    Accumulators use a bounded amount of memory, however many values they
+    see, and can be merged so that batches may be summarised in parallel.
+    """
+
+    @abstractmethod
+    def update(self, values: pyarrow.Array) -> None:
+        """Add a batch of values to the summary."""
+
+    @abstractmethod
+    def merge(self: _AccumulatorT, other: _AccumulatorT) -> None:
+        """Add the values summarised by another accumulator of the same kind."""
+
+
+_AccumulatorT = TypeVar("_AccumulatorT", bound=Accumulator)
+
+
+class AggregateCheck(Check, Generic[_AccumulatorT]):
+    """A check on a summary of all of a column's values, such as its mean.
+
+    Validation accumulates the summary during the same pass over the data
+    as elementwise checks. When called directly, every row of the result
+    holds the outcome of the check.
+    """
+
+    @abstractmethod
+    def accumulator(self) -> _AccumulatorT:
+        """Create an empty accumulator for this check."""
+
+    @abstractmethod
+    def passes(self, accumulator: _AccumulatorT) -> bool:
+        """Whether the values summarised by ``accumulator`` pass the check."""
+
+    def __call__(
+        self,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
+        column: str,
+    ) -> pyarrow.ChunkedArray:
+        accumulator = self.accumulator()
+        num_rows = 0
+        for values in _column_batches(data, column):
+            accumulator.update(values)
+            num_rows += len(values)
+        return pyarrow.chunked_array(
+            [pyarrow.repeat(self.passes(accumulator), num_rows)],
+            type=pyarrow.bool_(),
+        )
+
+
 @dataclasses.dataclass(frozen=True)
 class All(Check):
     checks: Set[Check]
 
+    def __post_init__(self) -> None:
+        # Store a frozenset so that the check is hashable.
+        object.__setattr__(self, "checks", frozenset(self.checks))
+
     def __call__(
         self,
-        data: pyarrow.dataset.Dataset,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
         column: str,
     ) -> pyarrow.ChunkedArray:
+        import pyarrow.compute
+
         return functools.reduce(
             pyarrow.compute.and_,
             (check(data, column) for check in self.checks),
         )
 
+    def is_elementwise(self) -> bool:
+        return all(check.is_elementwise() for check in self.checks)
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return functools.reduce(
+            pyarrow.compute.and_,
+            (check.evaluate(values) for check in self.checks),
+        )
+
 
 @dataclasses.dataclass(frozen=True)
 class Any_(Check):
     checks: Set[Check]
 
+    def __post_init__(self) -> None:
+        # Store a frozenset so that the check is hashable.
+        object.__setattr__(self, "checks", frozenset(self.checks))
+
     def __call__(
         self,
-        data: pyarrow.dataset.Dataset,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
         column: str,
     ) -> pyarrow.ChunkedArray:
+        import pyarrow.compute
+
         return functools.reduce(
             pyarrow.compute.or_,
             (check(data, column) for check in self.checks),
         )
 
+    def is_elementwise(self) -> bool:
+        return all(check.is_elementwise() for check in self.checks)
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return functools.reduce(
+            pyarrow.compute.or_,
+            (check.evaluate(values) for check in self.checks),
+        )
+
 
 @dataclasses.dataclass(frozen=True)
-class Unique(Check):
+class StructField(Check):
+    """Apply a check to a child of a struct column.
+
+    The child is accessed without copying its values. Rows where the
+    struct itself is null are null in the child.
+    """
+
+    name: str
+    check: Check
+
     def __call__(
         self,
-        data: pyarrow.dataset.Dataset,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
         column: str,
     ) -> pyarrow.ChunkedArray:
-        # Use Acero directly since Datasets do not have a `.gourp_by` method.
-        data_source = pyarrow.acero._dataset_to_decl(data, use_threads=True)
-        declaration = pyarrow.acero.Declaration.from_sequence(
+        import pyarrow.compute
+
+        if self.is_elementwise():
+            return _evaluate_batches(self, data, column)
+        if isinstance(data, pyarrow.Table):
+            child = pyarrow.compute.struct_field(
+                data.column(column), [self.name], memory_pool=_memory_pool()
+            )
+            children = pyarrow.table({column: child})
+        else:
+            children = data.to_table(
+                columns={column: pyarrow.compute.field(column, self.name)},
+            )
+        return self.check(children, column)
+
+    def is_elementwise(self) -> bool:
+        return self.check.is_elementwise()
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return self.check.evaluate(
+            pyarrow.compute.struct_field(
+                values, [self.name], memory_pool=_memory_pool()
+            ),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class ListElements(Check):
+    """Apply a check to every element of a list column.
+
+    A row passes if all of its elements pass, so empty lists pass and null
+    lists are null. Unless some lists are null, the elements are checked
+    without copying them. The results are mapped back to rows through the
+    list offsets.
+    """
+
+    check: Check
+
+    def __call__(
+        self,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
+        column: str,
+    ) -> pyarrow.ChunkedArray:
+        import numpy
+
+        if self.is_elementwise():
+            return _evaluate_batches(self, data, column)
+
+        lists = []
+        elements = []
+        parents = []
+        num_rows = 0
+        for values in _column_batches(data, column):
+            batch_elements, batch_parents = _list_elements(values)
+            lists.append(values)
+            elements.append(batch_elements)
+            parents.append(batch_parents + num_rows)
+            num_rows += len(values)
+        results = self.check(
+            pyarrow.table(
+                {
+                    column: pyarrow.chunked_array(
+                        elements, type=_value_type(data, column)
+                    )
+                }
+            ),
+            column,
+        )
+        return pyarrow.chunked_array(
             [
-                data_source,
-                pyarrow.acero.Declaration(
-                    "aggregate",
-                    pyarrow.acero.AggregateNodeOptions(
-                        [
-                            (
-                                column,  # target column
-                                "hash_count",  # aggregate function
-                                None,  # aggregate function options
-                                "count",  # output field name
-                            )
-                        ],
-                        keys=column,
-                    ),
-                ),
-                pyarrow.acero.Declaration(
-                    "project",
-                    pyarrow.acero.ProjectNodeOptions(
-                        [
-                            pyarrow.compute.field(column),
-                            pyarrow.compute.field("count") == 1,
-                        ],
-                        [
-                            column,
-                            "unique",
-                        ],
-                    ),
+                _rows_passing(
+                    pyarrow.chunked_array(lists, type=data.schema.field(column).type),
+                    numpy.concatenate(parents) if parents else numpy.empty(0, int),
+                    results,
                 ),
             ],
-        )
-        return (
-            data.join(
-                declaration.to_table(use_threads=True),
-                column,
-                join_type="left outer",
-            )
-            .to_table(
-                columns=["unique"],
-            )
-            .column(
-                "unique",
-            )
+            type=pyarrow.bool_(),
         )
 
+    def is_elementwise(self) -> bool:
+        return self.check.is_elementwise()
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        elements, parents = _list_elements(values)
+        return _rows_passing(values, parents, self.check.evaluate(elements))
+
 
 @dataclasses.dataclass(frozen=True)
-class Greater(Check):
-    value: Any
+class PerPartition(Check):
+    """Apply a check to each partition of a Dataset independently.
+
+    Partitions follow the Dataset's partitioning, such as the directories
+    of a hive-partitioned Dataset, and a Table is a single partition. So
+    ``PerPartition(Unique())`` checks that values are unique within each
+    partition. Partitions are checked one at a time, so only the largest
+    one needs to fit in memory, unless ``max_workers`` is more than one, in
+    which case up to that many are checked concurrently and need memory at
+    once. The results are put back in the order of the rows.
+
+    Elementwise checks are not affected by partitioning, so they are
+    evaluated over the whole column as usual.
+    """
+
+    check: Check
+    max_workers: int = 1
+
+    def __post_init__(self) -> None:
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
 
     def __call__(
         self,
-        data: pyarrow.dataset.Dataset,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
         column: str,
     ) -> pyarrow.ChunkedArray:
-        arrays = []
-        for batch in data.to_batches(columns=[column]):
-            arrays.append(pyarrow.compute.greater(batch.column(0), self.value))
-        return pyarrow.chunked_array(arrays)
+        if self.is_elementwise():
+            return _evaluate_batches(self, data, column)
+        results = self._check_partitions(data, column)
+        if len(results) == 1:
+            return results[0][1]
+        return _rows_in_order(data, results)
+
+    def partition_results(
+        self,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
+        column: str,
+    ) -> dict[str, pyarrow.ChunkedArray]:
+        """Check each partition, keyed by its partition expression."""
+        return {
+            str(expression): result
+            for expression, result in self._check_partitions(data, column)
+        }
+
+    def _check_partitions(
+        self,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
+        column: str,
+    ) -> list[tuple[pyarrow.compute.Expression, pyarrow.ChunkedArray]]:
+        import concurrent.futures
+
+        partitions = _partition_expressions(data)
+        if len(partitions) == 1:
+            return [(partitions[0], self.check(data, column))]
+        if self.max_workers == 1:
+            return [
+                (expression, self.check(data.filter(expression), column))
+                for expression in partitions
+            ]
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as pool:
+            futures = [
+                pool.submit(
+                    # Run in a copy of the context, for its memory pool.
+                    contextvars.copy_context().run,
+                    self.check,
+                    data.filter(expression),
+                    column,
+                )
+                for expression in partitions
+            ]
+            return [
+                (expression, future.result())
+                for expression, future in zip(partitions, futures)
+            ]
+
+    def is_elementwise(self) -> bool:
+        return self.check.is_elementwise()
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        return self.check.evaluate(values)
+
+
+def _rows_in_order(
+    data: pyarrow.dataset.Dataset,
+    results: list[tuple[pyarrow.compute.Expression, pyarrow.ChunkedArray]],
+) -> pyarrow.ChunkedArray:
+    """Put the results of each partition of a Dataset in the order of its rows.
+
+    The rows of each partition are found by reading the partition columns,
+    which are not stored in the files, with the number of each row.
+    """
+    import numpy
+    import pyarrow.compute
+
+    keys = data.to_table(columns=data.partitioning.schema.names)
+    row_numbers = keys.append_column(
+        # A name which cannot clash with a partition column.
+        ".row",
+        pyarrow.array(numpy.arange(keys.num_rows), memory_pool=_memory_pool()),
+    )
+    passed = numpy.zeros(keys.num_rows, dtype=bool)
+    valid = numpy.zeros(keys.num_rows, dtype=bool)
+    for expression, result in results:
+        rows = row_numbers.filter(expression).column(".row").to_numpy()
+        passed[rows] = pyarrow.compute.fill_null(result, False).to_numpy()
+        valid[rows] = pyarrow.compute.is_valid(
+            result, memory_pool=_memory_pool()
+        ).to_numpy()
+    return pyarrow.chunked_array(
+        [pyarrow.array(passed, mask=~valid, memory_pool=_memory_pool())],
+    )
+
+
+def _partition_expressions(
+    data: pyarrow.Table | pyarrow.dataset.Dataset,
+) -> list[pyarrow.compute.Expression]:
+    """The expression selecting each partition of a Dataset."""
+    import pyarrow.acero
+    import pyarrow.compute
+
+    partitioning = getattr(data, "partitioning", None)
+    names = [] if partitioning is None else partitioning.schema.names
+    if isinstance(data, pyarrow.Table) or not names:
+        return [pyarrow.compute.scalar(True)]
+    if data._scan_options.get("filter") is None:
+        # The partitions are known from the fragments, without reading them.
+        expressions: dict[str, pyarrow.compute.Expression] = {}
+        for fragment in data.get_fragments():
+            expression = fragment.partition_expression
+            expressions.setdefault(str(expression), expression)
+        return list(expressions.values())
+
+    # Filtered Datasets do not list their fragments, so scan the partition
+    # columns, which are not stored in the files, for their distinct values.
+    keys = pyarrow.acero.Declaration.from_sequence(
+        [
+            _scan_columns(data, names),
+            pyarrow.acero.Declaration(
+                "aggregate",
+                pyarrow.acero.AggregateNodeOptions([], keys=names),
+            ),
+        ],
+    ).to_table(use_threads=True)
+    return [
+        functools.reduce(
+            pyarrow.compute.Expression.__and__,
+            (
+                pyarrow.compute.field(name).is_null()
+                if value is None
+                else pyarrow.compute.field(name) == value
+                for name, value in row.items()
+            ),
+        )
+        for row in keys.to_pylist()
+    ]
+
+
+def _value_type(
+    data: pyarrow.Table | pyarrow.dataset.Dataset,
+    column: str,
+) -> pyarrow.DataType:
+    return data.schema.field(column).type.value_type
+
+
+def _list_elements(
+    values: pyarrow.Array,
+) -> tuple[pyarrow.Array, numpy.ndarray]:
+    """The elements of the non-null lists and the index of each one's list."""
+    import numpy
+    import pyarrow.compute
+
+    if pyarrow.types.is_fixed_size_list(values.type):
+        size = values.type.list_size
+        start = values.offset * size
+        lengths = numpy.full(len(values), size)
+    else:
+        offsets = values.offsets.to_numpy()
+        start = int(offsets[0])
+        lengths = numpy.diff(offsets)
+    parents = numpy.repeat(numpy.arange(len(values)), lengths)
+    elements = values.values.slice(start, len(parents))
+    if values.null_count:
+        # Null lists may still cover a range of the values, which could
+        # hold anything.
+        in_valid_list = pyarrow.compute.is_valid(
+            values, memory_pool=_memory_pool()
+        ).to_numpy(
+            zero_copy_only=False,
+        )[parents]
+        elements = elements.filter(
+            pyarrow.array(in_valid_list, memory_pool=_memory_pool())
+        )
+        parents = parents[in_valid_list]
+    return elements, parents
+
+
+def _rows_passing(
+    lists: pyarrow.Array | pyarrow.ChunkedArray,
+    parents: numpy.ndarray,
+    results: pyarrow.Array | pyarrow.ChunkedArray,
+) -> pyarrow.Array:
+    """Whether all elements of each list passed a check."""
+    import numpy
+    import pyarrow.compute
+
+    passed = numpy.ones(len(lists), dtype=bool)
+    failed = ~numpy.asarray(pyarrow.compute.fill_null(results, True))
+    passed[parents[failed]] = False
+    mask = (
+        numpy.asarray(pyarrow.compute.is_null(lists, memory_pool=_memory_pool()))
+        if lists.null_count
+        else None
+    )
+    return pyarrow.array(passed, mask=mask, memory_pool=_memory_pool())
 
 
 @dataclasses.dataclass(frozen=True)
-class GreaterEqual(Check):
-    value: Any
+class Unique(Check):
+    """Each non-null value occurs only once.
+
+    The values are counted in a hash table. If ``num_partitions`` is more
+    than one, the values are first split by hash into that many partitions,
+    which are spilled to temporary files and counted one at a time, so that
+    the hash table only ever holds a single partition.
+
+    If ``presorted`` is true, the values are expected to be sorted, so that
+    duplicates are next to each other. They are then compared with their
+    neighbours in a single streaming pass, without a hash table. If they
+    turn out not to be sorted, the values are counted as usual.
+    """
+
+    num_partitions: int = 1
+    presorted: bool = False
+
+    def __post_init__(self) -> None:
+        if self.num_partitions < 1:
+            raise ValueError("num_partitions must be at least 1.")
 
     def __call__(
         self,
-        data: pyarrow.dataset.Dataset,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
         column: str,
     ) -> pyarrow.ChunkedArray:
-        arrays = []
-        for batch in data.to_batches(columns=[column]):
-            arrays.append(pyarrow.compute.greater_equal(batch.column(0), self.value))
-        return pyarrow.chunked_array(arrays)
+        import pyarrow.acero
+        import pyarrow.compute
+
+        if self.presorted:
+            result = _unique_sorted(data, column)
+            if result is not None:
+                return result
+        if self.num_partitions > 1:
+            return _unique_partitioned(data, column, self.num_partitions)
+
+        # Use Acero directly since Datasets do not have a `.group_by` method.
+        duplicated = (
+            pyarrow.acero.Declaration.from_sequence(
+                [
+                    _scan_columns(data, [column]),
+                    pyarrow.acero.Declaration(
+                        "aggregate",
+                        pyarrow.acero.AggregateNodeOptions(
+                            [
+                                (
+                                    column,  # target column
+                                    "hash_count",  # aggregate function
+                                    None,  # aggregate function options
+                                    "count",  # output field name
+                                )
+                            ],
+                            keys=[column],
+                        ),
+                    ),
+                    pyarrow.acero.Declaration(
+                        "filter",
+                        pyarrow.acero.FilterNodeOptions(
+                            pyarrow.compute.field("count") > 1,
+                        ),
+                    ),
+                ],
+            )
+            .to_table(use_threads=True)
+            .column(column)
+            .combine_chunks()
+        )
+        if pyarrow.types.is_dictionary(duplicated.type):
+            duplicated = duplicated.dictionary_decode()
+
+        # Look the values up again in a second pass, rather than joining them
+        # with the counts, so the results are in the same order as the rows.
+        results = []
+        for values in _column_batches(data, column):
+            if pyarrow.types.is_dictionary(values.type):
+                values = values.dictionary_decode()
+            results.append(
+                pyarrow.compute.if_else(
+                    pyarrow.compute.is_valid(values, memory_pool=_memory_pool()),
+                    pyarrow.compute.invert(
+                        pyarrow.compute.is_in(
+                            values, value_set=duplicated, memory_pool=_memory_pool()
+                        ),
+                        memory_pool=_memory_pool(),
+                    ),
+                    None,
+                    memory_pool=_memory_pool(),
+                ),
+            )
+        return pyarrow.chunked_array(results, type=pyarrow.bool_())
+
+
+def _unique_partitioned(
+    data: pyarrow.Table | pyarrow.dataset.Dataset,
+    column: str,
+    num_partitions: int,
+) -> pyarrow.ChunkedArray:
+    """Check uniqueness one hash partition at a time.
+
+    Each non-null value is written with its row number to the temporary
+    file of its partition. Equal values always share a partition, so each
+    partition's duplicates can be found on their own.
+    """
+    import os
+    import tempfile
+
+    import numpy
+    import pyarrow.compute
+    import pyarrow.ipc
+
+    from .sketches import _hash_each
+
+    value_type = data.schema.field(column).type
+    if pyarrow.types.is_dictionary(value_type):
+        value_type = value_type.value_type
+    schema = pyarrow.schema([(column, value_type), ("row", pyarrow.int64())])
+
+    with tempfile.TemporaryDirectory(prefix="iudex-") as directory:
+        paths = [os.path.join(directory, f"{i}.arrow") for i in range(num_partitions)]
+        num_rows = 0
+        null_rows = []
+        writers = [pyarrow.ipc.new_file(path, schema) for path in paths]
+        try:
+            for values in _column_batches(data, column):
+                if pyarrow.types.is_dictionary(values.type):
+                    values = values.dictionary_decode()
+                rows = numpy.arange(num_rows, num_rows + len(values))
+                num_rows += len(values)
+                if values.null_count:
+                    valid = numpy.asarray(
+                        pyarrow.compute.is_valid(values, memory_pool=_memory_pool())
+                    )
+                    null_rows.append(rows[~valid])
+                    values = values.filter(
+                        pyarrow.array(valid, memory_pool=_memory_pool())
+                    )
+                    rows = rows[valid]
+                partitions = _hash_each(values) % numpy.uint64(num_partitions)
+                batch = pyarrow.record_batch([values, rows], schema=schema)
+                for i, writer in enumerate(writers):
+                    writer.write_batch(
+                        batch.filter(
+                            pyarrow.array(partitions == i, memory_pool=_memory_pool())
+                        )
+                    )
+        finally:
+            for writer in writers:
+                writer.close()
+
+        unique = numpy.ones(num_rows, dtype=bool)
+        for path in paths:
+            with pyarrow.memory_map(path) as source:
+                partition = pyarrow.ipc.open_file(source).read_all()
+                counts = partition.group_by(column).aggregate([(column, "count")])
+                duplicated = counts.filter(
+                    pyarrow.compute.greater(
+                        counts.column(f"{column}_count"), 1, memory_pool=_memory_pool()
+                    ),
+                ).column(column)
+                if len(duplicated):
+                    rows = partition.filter(
+                        pyarrow.compute.is_in(
+                            partition.column(column),
+                            value_set=duplicated.combine_chunks(),
+                            memory_pool=_memory_pool(),
+                        ),
+                    ).column("row")
+                    unique[numpy.asarray(rows)] = False
+                # Release the partition before the next one is read.
+                del partition, counts, duplicated
+
+    mask = numpy.zeros(num_rows, dtype=bool)
+    if null_rows:
+        mask[numpy.concatenate(null_rows)] = True
+    return pyarrow.chunked_array(
+        [pyarrow.array(unique, mask=mask, memory_pool=_memory_pool())],
+        type=pyarrow.bool_(),
+    )
+
+
+def _unique_sorted(
+    data: pyarrow.Table | pyarrow.dataset.Dataset,
+    column: str,
+) -> pyarrow.ChunkedArray | None:
+    """Check uniqueness by comparing each value with its neighbours.
+
+    Returns None if the values are not sorted in either direction.
+    """
+    import numpy
+    import pyarrow.compute
+
+    increasing = decreasing = True
+    passed: list[numpy.ndarray] = []
+    nulls: list[numpy.ndarray] = []
+    # The batch and position of the last non-null value so far.
+    last: tuple[int, int] | None = None
+    for values, previous in _with_previous(data, column):
+        increasing = increasing and _all_or_null(
+            pyarrow.compute.greater_equal(values, previous, memory_pool=_memory_pool()),
+        )
+        decreasing = decreasing and _all_or_null(
+            pyarrow.compute.less_equal(values, previous, memory_pool=_memory_pool()),
+        )
+        if not (increasing or decreasing):
+            return None
+        equal = numpy.asarray(
+            pyarrow.compute.fill_null(
+                pyarrow.compute.equal(values, previous, memory_pool=_memory_pool()),
+                False,
+            ),
+        )
+        valid = numpy.asarray(
+            pyarrow.compute.is_valid(values, memory_pool=_memory_pool())
+        )
+        # A value is a duplicate if it equals the previous non-null value,
+        # or if the next non-null value equals it.
+        batch_passed = ~equal
+        positions = numpy.flatnonzero(valid)
+        if len(positions):
+            batch_passed[positions[:-1]] &= ~equal[positions[1:]]
+            if last is not None and equal[positions[0]]:
+                passed[last[0]][last[1]] = False
+            last = (len(passed), int(positions[-1]))
+        passed.append(batch_passed)
+        nulls.append(~valid)
+    return pyarrow.chunked_array(
+        [
+            pyarrow.array(p, mask=n, memory_pool=_memory_pool())
+            for p, n in zip(passed, nulls)
+        ],
+        type=pyarrow.bool_(),
+    )
 
 
 @dataclasses.dataclass(frozen=True)
-class Less(Check):
-    value: Any
+class MonotonicIncreasing(Check):
+    """Each value is at least the previous non-null value, or greater than
+    it if ``strict``.
+
+    Rows are taken in the order they are stored, which for a Dataset is
+    the order of its fragments. The values are compared with their
+    neighbours in a single streaming pass.
+    """
+
+    strict: bool = False
 
     def __call__(
         self,
-        data: pyarrow.dataset.Dataset,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
         column: str,
     ) -> pyarrow.ChunkedArray:
-        arrays = []
-        for batch in data.to_batches(columns=[column]):
-            arrays.append(pyarrow.compute.less(batch.column(0), self.value))
-        return pyarrow.chunked_array(arrays)
+        return _compare_previous(
+            data,
+            column,
+            "greater" if self.strict else "greater_equal",
+        )
 
 
 @dataclasses.dataclass(frozen=True)
-class LessEqual(Check):
-    value: Any
+class MonotonicDecreasing(Check):
+    """Each value is at most the previous non-null value, or less than it
+    if ``strict``.
+
+    Rows are taken in the order they are stored, which for a Dataset is
+    the order of its fragments. The values are compared with their
+    neighbours in a single streaming pass.
+    """
+
+    strict: bool = False
 
     def __call__(
         self,
-        data: pyarrow.dataset.Dataset,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
         column: str,
     ) -> pyarrow.ChunkedArray:
-        arrays = []
+        return _compare_previous(
+            data,
+            column,
+            "less" if self.strict else "less_equal",
+        )
+
+
+def _compare_previous(
+    data: pyarrow.Table | pyarrow.dataset.Dataset,
+    column: str,
+    function: str,
+) -> pyarrow.ChunkedArray:
+    """Compare each value with the previous non-null value.
+
+    The first non-null value passes, and nulls are null.
+    """
+    import pyarrow.compute
+
+    results = []
+    for values, previous in _with_previous(data, column):
+        result = pyarrow.compute.call_function(
+            function, [values, previous], memory_pool=_memory_pool()
+        )
+        first = pyarrow.compute.and_(
+            pyarrow.compute.is_null(previous, memory_pool=_memory_pool()),
+            pyarrow.compute.is_valid(values, memory_pool=_memory_pool()),
+            memory_pool=_memory_pool(),
+        )
+        results.append(
+            pyarrow.compute.if_else(first, True, result, memory_pool=_memory_pool())
+        )
+    return pyarrow.chunked_array(results, type=pyarrow.bool_())
+
+
+def _with_previous(
+    data: pyarrow.Table | pyarrow.dataset.Dataset,
+    column: str,
+) -> Iterator[tuple[pyarrow.Array, pyarrow.Array]]:
+    """Pair each batch of values with the previous non-null value of each row.
+
+    The previous values carry over from one batch to the next, and are null
+    before the first non-null value.
+    """
+    import pyarrow.compute
+
+    # The last non-null value so far, as an array of one value.
+    carry = None
+    for values in _column_batches(data, column):
+        if pyarrow.types.is_dictionary(values.type):
+            values = values.dictionary_decode()
+        if not len(values):
+            continue
+        if carry is None:
+            carry = pyarrow.nulls(1, values.type)
+        filled = pyarrow.compute.coalesce(
+            pyarrow.compute.fill_null_forward(values, memory_pool=_memory_pool()),
+            carry[0],
+            memory_pool=_memory_pool(),
+        )
+        previous = pyarrow.concat_arrays([carry, filled.slice(0, len(values) - 1)])
+        carry = filled.slice(len(values) - 1)
+        yield values, previous
+
+
+def _all_or_null(mask: pyarrow.Array) -> bool:
+    """Whether no value of a mask is false."""
+    import pyarrow.compute
+
+    return pyarrow.compute.all(mask, memory_pool=_memory_pool()).as_py() is not False
+
+
+def _scan_columns(
+    data: pyarrow.Table | pyarrow.dataset.Dataset,
+    columns: list[str],
+) -> pyarrow.acero.Declaration:
+    """Scan some columns of a Dataset, reading no other columns."""
+    import pyarrow.acero
+    import pyarrow.compute
+
+    if isinstance(data, pyarrow.Table):
+        return pyarrow.acero.Declaration(
+            "table_source",
+            pyarrow.acero.TableSourceNodeOptions(data.select(columns)),
+        )
+
+    declarations = [
+        pyarrow.acero.Declaration(
+            "scan",
+            pyarrow.acero.ScanNodeOptions(
+                data,
+                columns=columns,
+                use_threads=True,
+            ),
+        ),
+    ]
+    filter_expr = data._scan_options.get("filter")
+    if filter_expr is not None:
+        # The scan node only uses the filter for pushdown, so it must be
+        # applied again.
+        declarations.append(
+            pyarrow.acero.Declaration(
+                "filter",
+                pyarrow.acero.FilterNodeOptions(filter_expr),
+            ),
+        )
+    declarations.append(
+        pyarrow.acero.Declaration(
+            "project",
+            pyarrow.acero.ProjectNodeOptions(
+                [pyarrow.compute.field(column) for column in columns],
+                columns,
+            ),
+        ),
+    )
+    return pyarrow.acero.Declaration.from_sequence(declarations)
+
+
+def _column_batches(
+    data: pyarrow.Table | pyarrow.dataset.Dataset,
+    column: str,
+) -> Iterator[pyarrow.Array]:
+    """Iterate over the values of a column one batch at a time."""
+    if isinstance(data, pyarrow.Table):
+        yield from data.column(column).chunks
+    else:
         for batch in data.to_batches(columns=[column]):
-            arrays.append(pyarrow.compute.less_equal(batch.column(0), self.value))
-        return pyarrow.chunked_array(arrays)
+            yield batch.column(0)
+
+
+def _evaluate_batches(
+    check: Check,
+    data: pyarrow.Table | pyarrow.dataset.Dataset,
+    column: str,
+) -> pyarrow.ChunkedArray:
+    return pyarrow.chunked_array(
+        [check.evaluate(values) for values in _column_batches(data, column)],
+        type=pyarrow.bool_(),
+    )
+
+
+def _comparable(value: Any) -> Any:
+    """Arrow converts Python integers to int64, so larger ones to uint64."""
+    if isinstance(value, int) and value >= 2**63:
+        return pyarrow.scalar(value, pyarrow.uint64())
+    return value
 
 
 @dataclasses.dataclass(frozen=True)
-class IsIn(Check):
+class Greater(ElementwiseCheck):
+    value: Any
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.greater(
+            values, _comparable(self.value), memory_pool=_memory_pool()
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class GreaterEqual(ElementwiseCheck):
+    value: Any
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.greater_equal(
+            values, _comparable(self.value), memory_pool=_memory_pool()
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Less(ElementwiseCheck):
+    value: Any
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.less(
+            values, _comparable(self.value), memory_pool=_memory_pool()
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class LessEqual(ElementwiseCheck):
+    value: Any
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.less_equal(
+            values, _comparable(self.value), memory_pool=_memory_pool()
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class IsIn(ElementwiseCheck):
     values: Set[Any]
 
     def __post_init__(self) -> None:
         if not self.values:
             raise ValueError("Value set must contain at least one value.")
+        # Store a frozenset so that the check is hashable.
+        object.__setattr__(self, "values", frozenset(self.values))
 
-    def __call__(
-        self,
-        data: pyarrow.dataset.Dataset,
-        column: str,
-    ) -> pyarrow.ChunkedArray:
-        arrays = []
-        for batch in data.to_batches(columns=[column]):
-            arrays.append(
-                pyarrow.compute.is_in(batch.column(0), pyarrow.array(self.values)),
-            )
-        return pyarrow.chunked_array(arrays)
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.is_in(
+            values,
+            pyarrow.array(self.values, memory_pool=_memory_pool()),
+            memory_pool=_memory_pool(),
+        )
 
 
 @dataclasses.dataclass(frozen=True)
-class NotIn(Check):
+class NotIn(ElementwiseCheck):
     values: Set[Any]
 
     def __post_init__(self) -> None:
         if not self.values:
             raise ValueError("Value set must contain at least one value.")
+        # Store a frozenset so that the check is hashable.
+        object.__setattr__(self, "values", frozenset(self.values))
 
-    def __call__(
-        self,
-        data: pyarrow.dataset.Dataset,
-        column: str,
-    ) -> pyarrow.ChunkedArray:
-        return pyarrow.compute.invert(IsIn(self.values)(data, column))
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.invert(
+            IsIn(self.values).evaluate(values), memory_pool=_memory_pool()
+        )
+
+
+class _StringCheck(ElementwiseCheck):
+    """An elementwise check on string or binary values.
+
+    Dictionary-encoded values are checked once per dictionary entry.
+    """
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        if pyarrow.types.is_dictionary(values.type):
+            return self.evaluate_strings(values.dictionary).take(values.indices)
+        return self.evaluate_strings(values)
+
+    @abstractmethod
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        ...
+
+
+@dataclasses.dataclass(frozen=True)
+class MatchesRegex(_StringCheck):
+    """The value contains a match for a RE2 regular expression.
+
+    Anchor the pattern with ``^`` and ``$`` to match whole values.
+    """
+
+    pattern: str
+    ignore_case: bool = False
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.match_substring_regex(
+            values,
+            self.pattern,
+            ignore_case=self.ignore_case,
+            memory_pool=_memory_pool(),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class StartsWith(_StringCheck):
+    prefix: str
+    ignore_case: bool = False
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.starts_with(
+            values,
+            self.prefix,
+            ignore_case=self.ignore_case,
+            memory_pool=_memory_pool(),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class EndsWith(_StringCheck):
+    suffix: str
+    ignore_case: bool = False
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.ends_with(
+            values,
+            self.suffix,
+            ignore_case=self.ignore_case,
+            memory_pool=_memory_pool(),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Length(_StringCheck):
+    """The length of the value is within inclusive bounds.
+
+    Strings are measured in characters and binary values in bytes.
+    """
+
+    lower: int | None = None
+    upper: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.lower is None and self.upper is None:
+            raise ValueError("At least one of lower or upper must be given.")
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        if pyarrow.types.is_binary(values.type) or pyarrow.types.is_large_binary(
+            values.type
+        ):
+            lengths = pyarrow.compute.binary_length(values, memory_pool=_memory_pool())
+        else:
+            lengths = pyarrow.compute.utf8_length(values, memory_pool=_memory_pool())
+        masks = []
+        if self.lower is not None:
+            masks.append(
+                pyarrow.compute.greater_equal(
+                    lengths, self.lower, memory_pool=_memory_pool()
+                )
+            )
+        if self.upper is not None:
+            masks.append(
+                pyarrow.compute.less_equal(
+                    lengths, self.upper, memory_pool=_memory_pool()
+                )
+            )
+        return functools.reduce(
+            functools.partial(pyarrow.compute.and_, memory_pool=_memory_pool()),
+            masks,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class IsAscii(_StringCheck):
+    """The value consists only of ASCII characters."""
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.string_is_ascii(values, memory_pool=_memory_pool())
+
+
+@dataclasses.dataclass(frozen=True)
+class IsAlpha(_StringCheck):
+    """The value is non-empty and consists only of alphabetic characters."""
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.utf8_is_alpha(values, memory_pool=_memory_pool())
+
+
+@dataclasses.dataclass(frozen=True)
+class IsAlphanumeric(_StringCheck):
+    """The value is non-empty and consists only of alphanumeric characters."""
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.utf8_is_alnum(values, memory_pool=_memory_pool())
+
+
+@dataclasses.dataclass(frozen=True)
+class IsDecimal(_StringCheck):
+    """The value is non-empty and consists only of decimal digits."""
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.utf8_is_decimal(values, memory_pool=_memory_pool())
+
+
+@dataclasses.dataclass(frozen=True)
+class IsNumeric(_StringCheck):
+    """The value is non-empty and consists only of numeric characters."""
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.utf8_is_numeric(values, memory_pool=_memory_pool())
+
+
+@dataclasses.dataclass(frozen=True)
+class IsValidUtf8(_StringCheck):
+    """The binary value is valid UTF-8."""
+
+    def evaluate_strings(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        large = pyarrow.types.is_large_binary(values.type)
+        try:
+            # Validating the whole batch at once is fastest, and only batches
+            # which contain invalid values need to be checked value by value.
+            valid = pyarrow.compute.is_valid(
+                values.cast(
+                    pyarrow.large_string() if large else pyarrow.string(),
+                    memory_pool=_memory_pool(),
+                ),
+                memory_pool=_memory_pool(),
+            )
+        except pyarrow.ArrowInvalid:
+            return _utf8_validity(
+                values.cast(
+                    pyarrow.large_binary() if large else pyarrow.binary(),
+                    memory_pool=_memory_pool(),
+                ),
+            )
+        # Nulls are neither valid nor invalid.
+        return pyarrow.compute.if_else(valid, True, None, memory_pool=_memory_pool())
+
+
+def _utf8_validity(values: pyarrow.Array) -> pyarrow.Array:
+    """Check each binary value is valid UTF-8 using NumPy on its buffers.
+
+    Every lead byte must be followed by the continuation bytes it needs, in
+    the same value, and the values must have no other continuation bytes.
+    The ranges of the second bytes of a sequence rule out overlong forms,
+    surrogates and code points above U+10FFFF.
+    """
+    import numpy
+
+    _, offsets_buffer, data_buffer = values.buffers()
+    offset_type = (
+        numpy.int64 if pyarrow.types.is_large_binary(values.type) else numpy.int32
+    )
+    offsets = numpy.frombuffer(offsets_buffer, dtype=offset_type)[
+        values.offset : values.offset + len(values) + 1
+    ].astype(numpy.int64)
+    data = numpy.frombuffer(data_buffer, dtype=numpy.uint8)[offsets[0] : offsets[-1]]
+    offsets -= offsets[0]
+    value_of = numpy.repeat(numpy.arange(len(values)), numpy.diff(offsets))
+    value_end = offsets[1:][value_of]
+
+    sizes, lows, highs = _utf8_tables()
+    size = sizes[data]
+    continuation = size == 0
+    invalid = size < 0
+    for i in range(1, 4):
+        lead = numpy.flatnonzero(size > i)
+        following = lead + i
+        in_value = following < value_end[lead]
+        following = numpy.minimum(following, len(data) - 1)
+        invalid[lead] |= ~(in_value & continuation[following])
+        if i == 1:
+            second = data[following]
+            invalid[lead] |= (second < lows[data[lead]]) | (second > highs[data[lead]])
+    # Each lead byte claims its continuation bytes, which cannot be claimed
+    # by another lead, so any left over are out of place.
+    unclaimed = continuation.astype(numpy.int64) - numpy.maximum(size - 1, 0)
+    invalid_count = numpy.bincount(value_of, weights=invalid, minlength=len(values))
+    unclaimed_count = numpy.bincount(
+        value_of,
+        weights=unclaimed,
+        minlength=len(values),
+    )
+    return pyarrow.array(
+        (invalid_count == 0) & (unclaimed_count == 0),
+        mask=values.is_null().to_numpy(zero_copy_only=False),
+        memory_pool=_memory_pool(),
+    )
+
+
+@functools.cache
+def _utf8_tables() -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    import numpy
+
+    # The number of bytes in the sequence each byte starts, 0 for
+    # continuation bytes and -1 for bytes which never appear in UTF-8.
+    size = numpy.full(256, -1, dtype=numpy.int8)
+    size[0x00:0x80] = 1
+    size[0x80:0xC0] = 0
+    size[0xC2:0xE0] = 2
+    size[0xE0:0xF0] = 3
+    size[0xF0:0xF5] = 4
+    low = numpy.full(256, 0x80, dtype=numpy.uint8)
+    high = numpy.full(256, 0xBF, dtype=numpy.uint8)
+    low[0xE0] = 0xA0  # Overlong three byte sequences.
+    high[0xED] = 0x9F  # Surrogates.
+    low[0xF0] = 0x90  # Overlong four byte sequences.
+    high[0xF4] = 0x8F  # Code points above U+10FFFF.
+    return size, low, high
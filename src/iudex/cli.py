@@ -0,0 +1,180 @@
+"""Validate files against a schema from the command line.
+
+Each file is reported as one JSON object per line on standard output, in
+the order validation finishes. The exit status is:
+
+    0  every file is valid.
+    1  at least one file does not match the schema or fails a check.
+    2  the command line was invalid or the schema could not be loaded.
+    3  at least one file could not be read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import glob
+import importlib
+import json
+import os
+import sys
+from collections.abc import Iterator, Sequence
+from typing import Any, TextIO
+
+import pyarrow
+
+from .errors import MemoryLimitError, SchemaError, ValidationError
+from .schema import Schema
+from .validate import validate_file
+
+EXIT_VALID = 0
+EXIT_INVALID = 1
+EXIT_USAGE = 2
+EXIT_UNREADABLE = 3
+
+_EXTENSIONS = (".arrow", ".csv", ".feather", ".ipc", ".parquet", ".pq")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        schema = load_schema(args.schema, args.app_dir)
+    except (ImportError, AttributeError, TypeError, ValueError) as e:
+        parser.exit(EXIT_USAGE, f"{parser.prog}: error: {e}\n")
+
+    paths = sorted(set(_expand_paths(args.paths, args.format)))
+    if not paths:
+        parser.exit(EXIT_USAGE, f"{parser.prog}: error: no files to validate\n")
+
+    return _run(paths, schema, args.format, args.jobs, sys.stdout)
+
+
+def load_schema(reference: str, app_dir: str | None = None) -> Schema:
+    """Load a Schema from a ``module:attribute`` reference.
+
+    The module is looked up in ``app_dir`` first, if given.
+    """
+    module_name, sep, attribute = reference.partition(":")
+    if not sep or not module_name or not attribute:
+        raise ValueError(
+            f"Schema reference {reference!r} must have the form 'module:attribute'.",
+        )
+    if app_dir is not None:
+        app_dir = os.path.abspath(app_dir)
+        if app_dir not in sys.path:
+            sys.path.insert(0, app_dir)
+    obj: Any = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        obj = getattr(obj, name)
+    if not isinstance(obj, Schema):
+        raise TypeError(f"{reference!r} is not an iudex Schema.")
+    return obj
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="iudex",
+        description="Validate Parquet, Arrow IPC/Feather and CSV files against a schema.",
+        epilog=(
+            "exit status: 0 if every file is valid, 1 if any file is invalid, "
+            "2 on usage errors and 3 if any file could not be read."
+        ),
+    )
+    parser.add_argument(
+        "schema",
+        help="the schema to validate against, as 'module:attribute'",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="path",
+        help="a file, a directory to search recursively or a glob pattern",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["parquet", "ipc", "feather", "csv"],
+        help="the file format, inferred from each file's extension by default",
+    )
+    parser.add_argument(
+        "--app-dir",
+        default=".",
+        help="the directory to import the schema's module from (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="the number of files to validate in parallel (default: %(default)s)",
+    )
+    return parser
+
+
+def _expand_paths(patterns: Sequence[str], format: str | None) -> Iterator[str]:
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, dirs, files in os.walk(pattern):
+                # Skip hidden and metadata files, such as `_SUCCESS` markers
+                # and `.crc` checksums, as Arrow Datasets do.
+                dirs[:] = [name for name in dirs if not _is_ignored(name)]
+                for name in files:
+                    if _is_ignored(name):
+                        continue
+                    if format is not None or name.lower().endswith(_EXTENSIONS):
+                        yield os.path.join(root, name)
+        elif any(char in pattern for char in "*?["):
+            yield from (
+                path
+                for path in glob.iglob(pattern, recursive=True)
+                if os.path.isfile(path)
+            )
+        else:
+            yield pattern
+
+
+def _is_ignored(name: str) -> bool:
+    return name.startswith((".", "_"))
+
+
+def _validate(
+    path: str,
+    schema: Schema,
+    format: str | None,
+    use_threads: bool,
+) -> dict[str, Any]:
+    try:
+        validate_file(path, schema, format, use_threads)
+    except (SchemaError, ValidationError) as e:
+        return {"path": path, "status": "invalid", "message": str(e)}
+    except (OSError, ValueError, MemoryLimitError, pyarrow.ArrowException) as e:
+        return {"path": path, "status": "error", "message": str(e)}
+    return {"path": path, "status": "valid"}
+
+
+def _run(
+    paths: Sequence[str],
+    schema: Schema,
+    format: str | None,
+    jobs: int,
+    out: TextIO,
+) -> int:
+    status = EXIT_VALID
+    # Files are already validated in parallel, so only let each validation
+    # use threads of its own if it runs alone.
+    use_threads = jobs <= 1 or len(paths) == 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+        futures = [
+            pool.submit(_validate, path, schema, format, use_threads) for path in paths
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            if result["status"] == "error":
+                status = EXIT_UNREADABLE
+            elif result["status"] == "invalid" and status == EXIT_VALID:
+                status = EXIT_INVALID
+    return status
@@ -4,3 +4,7 @@ class SchemaError(ValueError):
 
 class ValidationError(ValueError):
     pass
+
+
+class MemoryLimitError(MemoryError):
+    pass
@@ -0,0 +1,242 @@
+"""Propose a schema, with checks, from the data it should describe.
+
+The data is summarised in a single pass, shared between threads as in
+validation, by accumulators from `iudex.sketches` whose memory does not
+grow with the number of rows. The proposed checks only describe the data
+which was seen, so they should be reviewed before they are used.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import pyarrow
+
+from .checks import Accumulator, All, Check, GreaterEqual, IsIn, LessEqual, Unique
+from .schema import Field, Schema
+from .sketches import DistinctCounter, MinMax, NullCounter, ValueSet
+from .scan import MemoryBudget, Tracker, scan
+
+if TYPE_CHECKING:
+    import pyarrow.dataset
+
+
+class ColumnProfile(Accumulator):
+    """A summary of a column's values.
+
+    Counts the nulls and floating point NaNs, tracks the range, collects
+    the distinct values if there are at most ``max_values`` of them, and
+    estimates the number of distinct values with a HyperLogLog sketch of
+    the given ``precision``. The range is only tracked for numbers, dates
+    and times, and does not include NaNs.
+    """
+
+    def __init__(self, max_values: int = 20, precision: int = 12) -> None:
+        self.nulls = NullCounter()
+        self.nan_count = 0
+        self.range = MinMax()
+        self.values = ValueSet(max_values)
+        self.distinct = DistinctCounter(precision)
+
+    def update(self, values: pyarrow.Array) -> None:
+        import pyarrow.compute
+
+        self.nulls.update(values)
+        if pyarrow.types.is_floating(values.type):
+            self.nan_count += (
+                pyarrow.compute.sum(
+                    pyarrow.compute.is_nan(values),
+                ).as_py()
+                or 0
+            )
+        value_type = values.type
+        if pyarrow.types.is_dictionary(value_type):
+            value_type = value_type.value_type
+        if _is_ordered(value_type):
+            self.range.update(values)
+        self.values.update(values)
+        self.distinct.update(values)
+
+    def merge(self, other: ColumnProfile) -> None:
+        self.nulls.merge(other.nulls)
+        self.nan_count += other.nan_count
+        self.range.merge(other.range)
+        self.values.merge(other.values)
+        self.distinct.merge(other.distinct)
+
+    @property
+    def looks_unique(self) -> bool:
+        """Whether the non-null values seem to be distinct.
+
+        Allows for three standard errors of the distinct count estimate, so
+        this may be true even if a few values are repeated.
+        """
+        count = self.nulls.count - self.nulls.null_count
+        error = 1.04 / math.sqrt(2**self.distinct.precision)
+        return count > 1 and self.distinct.distinct_count >= count * (1 - 3 * error)
+
+
+def profile(
+    data: pyarrow.Table | pyarrow.RecordBatch | pyarrow.dataset.Dataset,
+    use_threads: bool = True,
+    max_rows: int | None = None,
+    max_values: int = 20,
+    precision: int = 12,
+) -> dict[str, ColumnProfile]:
+    """Summarise each column of a Table, RecordBatch or Dataset.
+
+    All columns are summarised in the same pass over the data, which stops
+    once at least ``max_rows`` rows have been read, if given. Columns of
+    nested types are not summarised.
+    """
+    if isinstance(data, pyarrow.RecordBatch):
+        data = pyarrow.Table.from_batches([data])
+    columns = [field.name for field in data.schema if _can_profile(field.type)]
+    if not columns:
+        return {}
+
+    def create() -> ColumnProfile:
+        return ColumnProfile(max_values, precision)
+
+    tracker = Tracker(
+        MemoryBudget(None, None),
+        timeout=None,
+        max_rows=max_rows,
+        max_bytes=None,
+        cancel=None,
+        callback=None,
+    )
+    _, accumulators, _ = scan(
+        data,
+        {},
+        {(name, None): create for name in columns},
+        use_threads,
+        tracker,
+    )
+    return {
+        name: accumulator
+        for (name, _), accumulator in accumulators.items()
+        if isinstance(accumulator, ColumnProfile)
+    }
+
+
+def infer_schema(
+    data: pyarrow.Table | pyarrow.RecordBatch | pyarrow.dataset.Dataset,
+    use_threads: bool = True,
+    max_rows: int | None = None,
+    max_values: int = 20,
+    precision: int = 12,
+    verify_unique: bool = False,
+) -> Schema:
+    """Propose a schema for a Table, RecordBatch or Dataset.
+
+    Fields have the data's types and nullability. A column with at most
+    ``max_values`` distinct values, other than floating point ones, is
+    checked with `IsIn`. Otherwise a column of numbers or times, other than
+    floating point ones with NaNs, is checked to be within the range of its
+    values. Neither is proposed for times with nanoseconds.
+
+    Whether a column's values are distinct is only estimated, by
+    `ColumnProfile.looks_unique`, so `Unique` is not proposed by default. If
+    ``verify_unique`` is true, columns which look unique are checked by an
+    exact `Unique` check over the first ``max_rows`` rows, or all of the
+    data, and are checked with `Unique` if that passes. This is another
+    pass over those rows, for each column, with memory growing with the
+    number of distinct values. See `profile` for the other arguments.
+    """
+    if isinstance(data, pyarrow.RecordBatch):
+        data = pyarrow.Table.from_batches([data])
+    profiles = profile(data, use_threads, max_rows, max_values, precision)
+    # The rows to check for uniqueness, if any.
+    unique_data = None
+    if verify_unique:
+        unique_data = data
+        if max_rows is not None and isinstance(data, pyarrow.Table):
+            unique_data = data.slice(0, max_rows)
+        elif max_rows is not None:
+            unique_data = data.head(max_rows)
+    return Schema(
+        [
+            Field(
+                field.name,
+                field.type,
+                nullable=field.nullable,
+                check=_propose_check(unique_data, field, profiles[field.name])
+                if field.name in profiles
+                else None,
+            )
+            for field in data.schema
+        ],
+    )
+
+
+def _can_profile(data_type: pyarrow.DataType) -> bool:
+    return not (
+        pyarrow.types.is_nested(data_type)
+        or pyarrow.types.is_null(data_type)
+        or pyarrow.types.is_interval(data_type)
+        or isinstance(data_type, pyarrow.ExtensionType)
+    )
+
+
+def _is_ordered(data_type: pyarrow.DataType) -> bool:
+    # Arrow cannot find the range of durations.
+    return (
+        pyarrow.types.is_integer(data_type)
+        or pyarrow.types.is_floating(data_type)
+        or pyarrow.types.is_decimal(data_type)
+        or pyarrow.types.is_date(data_type)
+        or pyarrow.types.is_time(data_type)
+        or pyarrow.types.is_timestamp(data_type)
+    )
+
+
+def _propose_check(
+    data: pyarrow.Table | pyarrow.dataset.Dataset | None,
+    field: pyarrow.Field,
+    column: ColumnProfile,
+) -> Check | None:
+    data_type = field.type
+    if pyarrow.types.is_dictionary(data_type):
+        data_type = data_type.value_type
+
+    checks: list[Check] = []
+    values = column.values.values
+    if _has_nanoseconds(data_type):
+        # Checks compare with Python values, which Arrow converts back with
+        # at most microsecond precision.
+        pass
+    elif values and not pyarrow.types.is_floating(data_type):
+        # `IsIn` only passes nulls which are in its value set.
+        if column.nulls.null_count:
+            values = values | {None}
+        checks.append(IsIn(values))
+    elif (
+        _is_ordered(data_type)
+        and column.range.min is not None
+        # NaNs fail any comparison.
+        and not column.nan_count
+    ):
+        checks.append(GreaterEqual(column.range.min))
+        checks.append(LessEqual(column.range.max))
+    if data is not None and column.looks_unique and _is_unique(data, field.name):
+        checks.append(Unique())
+
+    if len(checks) > 1:
+        return All(frozenset(checks))
+    return checks[0] if checks else None
+
+
+def _has_nanoseconds(data_type: pyarrow.DataType) -> bool:
+    return (
+        pyarrow.types.is_timestamp(data_type)
+        or pyarrow.types.is_time64(data_type)
+        or pyarrow.types.is_duration(data_type)
+    ) and data_type.unit == "ns"
+
+
+def _is_unique(data: pyarrow.Table | pyarrow.dataset.Dataset, column: str) -> bool:
+    import pyarrow.compute
+
+    return pyarrow.compute.all(Unique()(data, column)).as_py() is not False
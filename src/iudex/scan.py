@@ -0,0 +1,320 @@
+"""A single pass over data, shared between validation and inference.
+
+Batches are shared out between threads which evaluate elementwise checks
+and update accumulators, while a tracker records progress and decides
+when to stop. This module is internal to iudex.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import dataclasses
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING
+
+import pyarrow
+
+from .checks import Accumulator, Check
+from .errors import MemoryLimitError
+
+if TYPE_CHECKING:
+    import pyarrow.dataset
+
+# A check or accumulator of a column, keyed by the column's name first.
+ColumnKey = tuple[str, object]
+
+
+@dataclasses.dataclass(frozen=True)
+class Progress:
+    """How much of the data validation has covered so far."""
+
+    # Batches, rows and bytes read by the pass over the data which evaluates
+    # elementwise and aggregate checks.
+    batches: int = 0
+    rows: int = 0
+    bytes: int = 0
+    # Files of a Dataset which that pass has read completely.
+    fragments: int = 0
+    # Checks which scan the data themselves, finished and in total.
+    checks: int = 0
+    total_checks: int = 0
+
+
+# The size of the allocation which finds whether a pool allocates from the
+# default memory pool.
+_PROBE_BYTES = 1 << 16
+
+# Proxy pools which still had memory allocated through them when their run
+# finished. Freeing that memory once its proxy is gone would crash, so they
+# are kept until it has been freed.
+_RETAINED_POOLS: list[pyarrow.MemoryPool] = []
+_RETAINED_POOLS_LOCK = threading.Lock()
+
+
+class MemoryBudget:
+    """Tracks the memory allocated since validation started.
+
+    Datasets are read into ``pool``, the default memory pool if not given.
+    Checks allocate from `pool`, which wraps a given ``pool`` in a proxy
+    pool, so that the proxy's peak only covers this run even if ``pool`` is
+    shared between runs. Datasets are not read into the proxy, since they
+    keep using the pool they were first read with. The default memory pool
+    is tracked as well, since Acero always allocates from it, unless
+    ``pool`` allocates from it too. Call `close` once the run has finished.
+    """
+
+    def __init__(self, pool: pyarrow.MemoryPool | None, limit: int | None) -> None:
+        default = pyarrow.default_memory_pool()
+        self.dataset_pool = pool or default
+        self.limit = limit
+        self.peak = 0
+        self._proxy = None if pool is None else pyarrow.proxy_memory_pool(pool)
+        self.pool = self.dataset_pool if self._proxy is None else self._proxy
+        pools = [self.dataset_pool]
+        if pool is not None and not _allocates_from_default(pool):
+            pools.append(default)
+        # Each pool with the memory allocated from it, and its own peak, when
+        # validation started.
+        self._pools = [
+            (tracked, tracked.bytes_allocated(), tracked.max_memory())
+            for tracked in pools
+        ]
+
+    @property
+    def remaining(self) -> int | None:
+        """How many more bytes may be allocated, if there is a limit."""
+        if self.limit is None:
+            return None
+        used, _ = self._usage()
+        return self.limit - used
+
+    def sample(self) -> None:
+        """Record the peak memory use, raising if it is over the limit."""
+        _, peak = self._usage()
+        self.peak = max(self.peak, peak)
+        if self.limit is not None and self.peak > self.limit:
+            raise MemoryLimitError(
+                f"Validation allocated {self.peak} bytes, more than the limit "
+                f"of {self.limit} bytes.",
+            )
+
+    def close(self) -> None:
+        """Keep the proxy pool while memory allocated through it is in use."""
+        with _RETAINED_POOLS_LOCK:
+            _RETAINED_POOLS[:] = [
+                retained for retained in _RETAINED_POOLS if retained.bytes_allocated()
+            ]
+            if self._proxy is not None and self._proxy.bytes_allocated():
+                _RETAINED_POOLS.append(self._proxy)
+
+    def _usage(self) -> tuple[int, int]:
+        """The memory allocated now and the most allocated since the last sample."""
+        used = peak = 0
+        for tracked, allocated, max_memory in self._pools:
+            pool_used = tracked.bytes_allocated() - allocated
+            used += pool_used
+            # A pool's own peak shows memory which was allocated and freed
+            # since the last sample, once it is higher than before.
+            if tracked.max_memory() > max_memory:
+                pool_used = max(pool_used, tracked.max_memory() - allocated)
+            peak += pool_used
+        if self._proxy is not None:
+            # The proxy's peak covers this run alone. What is allocated
+            # through it is also allocated from ``pool``.
+            peak = max(
+                peak,
+                self._proxy.max_memory() + used - self._proxy.bytes_allocated(),
+            )
+        return used, peak
+
+
+def _allocates_from_default(pool: pyarrow.MemoryPool) -> bool:
+    """Whether memory allocated from ``pool`` comes from the default pool.
+
+    Pools cannot be compared, so a little memory is allocated from ``pool``
+    and looked for in the default pool's total.
+    """
+    default = pyarrow.default_memory_pool()
+    if pool.backend_name != default.backend_name:
+        return False
+    total = default.total_bytes_allocated()
+    pyarrow.allocate_buffer(_PROBE_BYTES, memory_pool=pool)
+    return default.total_bytes_allocated() - total >= _PROBE_BYTES
+
+
+class Tracker:
+    """Tracks what validation has covered and decides when it should stop."""
+
+    def __init__(
+        self,
+        memory: MemoryBudget,
+        timeout: float | None,
+        max_rows: int | None,
+        max_bytes: int | None,
+        cancel: threading.Event | None,
+        callback: Callable[[Progress], None] | None,
+    ) -> None:
+        self.memory = memory
+        self.progress = Progress()
+        self.stopped: str | None = None
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._cancel = cancel
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def should_stop(self, read_limits: bool = True) -> bool:
+        """Whether validation should stop, recording why if so.
+
+        The row and byte limits only apply if ``read_limits`` is true, which
+        should only be the case while there is data left to read.
+        """
+        if self.stopped is None:
+            if self._cancel is not None and self._cancel.is_set():
+                self.stopped = "cancelled"
+            elif self._deadline is not None and time.monotonic() >= self._deadline:
+                self.stopped = "timeout"
+            elif (
+                read_limits
+                and self._max_rows is not None
+                and self.progress.rows >= self._max_rows
+            ):
+                self.stopped = "max_rows"
+            elif (
+                read_limits
+                and self._max_bytes is not None
+                and self.progress.bytes >= self._max_bytes
+            ):
+                self.stopped = "max_bytes"
+        return self.stopped is not None
+
+    def update(self, **increments: int) -> None:
+        """Add to the progress counters and report the new progress."""
+        with self._lock:
+            self.progress = dataclasses.replace(
+                self.progress,
+                **{
+                    name: getattr(self.progress, name) + increment
+                    for name, increment in increments.items()
+                },
+            )
+            if self._callback is not None:
+                self._callback(self.progress)
+
+
+def scan(
+    source: pyarrow.Table | pyarrow.dataset.Dataset,
+    elementwise: Mapping[ColumnKey, Check],
+    accumulators: Mapping[ColumnKey, Callable[[], Accumulator]],
+    use_threads: bool,
+    tracker: Tracker,
+) -> tuple[set[ColumnKey], dict[ColumnKey, Accumulator], bool]:
+    """Evaluate elementwise checks and update accumulators in one pass.
+
+    Batches are shared out between workers, each of which keeps its own
+    accumulators, created by calling the values of ``accumulators``. These
+    are merged once all batches have been consumed. Returns the keys of the
+    elementwise checks which fail, the merged accumulators and whether the
+    pass covered all of the data.
+    """
+    import pyarrow.compute
+
+    columns = list(dict.fromkeys(name for name, _ in [*elementwise, *accumulators]))
+    num_workers = pyarrow.cpu_count() if use_threads else 1
+    batches: Iterator[pyarrow.RecordBatch]
+    if isinstance(source, pyarrow.Table):
+        table = source.select(columns)
+        batches = iter(table.to_batches())
+        num_workers = min(num_workers, table.column(0).num_chunks)
+    else:
+        batches = dataset_batches(source, columns, use_threads, num_workers, tracker)
+
+    lock = threading.Lock()
+    # Set when a worker fails or validation should stop, so that the other
+    # workers stop early.
+    stopped = threading.Event()
+    failed: set[ColumnKey] = set()
+
+    def consume() -> list[Accumulator]:
+        worker_accumulators = [create() for create in accumulators.values()]
+        while not stopped.is_set():
+            with lock:
+                batch = next(batches, None)
+            if batch is None:
+                break
+            if tracker.should_stop():
+                stopped.set()
+                break
+            for key, check in elementwise.items():
+                if key in failed:
+                    continue
+                mask = check.evaluate(batch.column(key[0]))
+                if not pyarrow.compute.all(
+                    mask,
+                    memory_pool=tracker.memory.pool,
+                ).as_py():
+                    failed.add(key)
+            for (name, _), accumulator in zip(accumulators, worker_accumulators):
+                accumulator.update(batch.column(name))
+            try:
+                tracker.memory.sample()
+            except MemoryLimitError:
+                stopped.set()
+                raise
+            tracker.update(batches=1, rows=batch.num_rows, bytes=batch.nbytes)
+        return worker_accumulators
+
+    if num_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(num_workers) as pool:
+            # Run each worker in a copy of the context, for its memory pool.
+            futures = [
+                pool.submit(contextvars.copy_context().run, consume)
+                for _ in range(num_workers)
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [consume()]
+
+    merged = {}
+    for i, key in enumerate(accumulators):
+        accumulator = results[0][i]
+        for worker_accumulators in results[1:]:
+            accumulator.merge(worker_accumulators[i])
+        merged[key] = accumulator
+
+    return failed, merged, not stopped.is_set()
+
+
+def dataset_batches(
+    source: pyarrow.dataset.Dataset,
+    columns: Sequence[str],
+    use_threads: bool,
+    num_workers: int,
+    tracker: Tracker,
+) -> Iterator[pyarrow.RecordBatch]:
+    """Read columns of a Dataset, counting files as they are completed."""
+    readahead = {}
+    if tracker.memory.limit is not None:
+        # Only read ahead as many batches as the workers can take.
+        readahead = {"batch_readahead": num_workers, "fragment_readahead": 1}
+    scanner = source.scanner(
+        columns=list(columns),
+        use_threads=use_threads,
+        memory_pool=tracker.memory.dataset_pool,
+        **readahead,
+    )
+    path = None
+    for tagged in scanner.scan_batches():
+        # Batches arrive in order, so a file is complete once the next one
+        # starts. Fragments held in memory have no path and are not counted.
+        fragment_path = getattr(tagged.fragment, "path", None)
+        if path is not None and fragment_path != path:
+            tracker.update(fragments=1)
+        path = fragment_path
+        yield tagged.record_batch
+    if path is not None:
+        tracker.update(fragments=1)
@@ -5,7 +5,11 @@ from collections.abc import Sequence
 
 import pyarrow
 
-from .checks import Check
+from .checks import All, Check, ListElements, StructField
+
+# Field metadata marking a column whose values are sorted, in either
+# direction.
+SORTED_METADATA_KEY = b"iudex.sorted"
 
 
 @dataclasses.dataclass(frozen=True)
@@ -21,12 +25,59 @@ class Schema:
 
 @dataclasses.dataclass(frozen=True)
 class Field:
-    """A field in a schema."""
+    """A field in a schema.
+
+    Struct and list fields may have children with checks of their own. The
+    children of a struct field describe some of its fields, and a list
+    field may have a single child describing its values.
+
+    If ``sorted`` is true, the field's values are expected to be sorted,
+    in either direction, which lets `Unique` compare neighbouring values
+    instead of counting them.
+    """
 
     name: str
     data_type: pyarrow.DataType
     nullable: bool = True
     check: Check | None = None
+    children: Sequence[Field] = ()
+    sorted: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.children:
+            return
+        if pyarrow.types.is_struct(self.data_type):
+            expected = {
+                self.data_type.field(i).name: self.data_type.field(i)
+                for i in range(self.data_type.num_fields)
+            }
+        elif _is_list(self.data_type):
+            if len(self.children) != 1:
+                raise ValueError("A list field must have a single child.")
+            expected = {self.children[0].name: self.data_type.value_field}
+        else:
+            raise ValueError("Only struct and list fields can have children.")
+        for child in self.children:
+            field = expected.get(child.name)
+            if field is None or not field.equals(child.to_pyarrow()):
+                raise ValueError(
+                    f"Child {child.name!r} does not match {self.data_type!r}.",
+                )
+
+    def nested_check(self) -> Check | None:
+        """The field's check, combined with the checks of its children."""
+        checks = [] if self.check is None else [self.check]
+        for child in self.children:
+            child_check = child.nested_check()
+            if child_check is None:
+                continue
+            if pyarrow.types.is_struct(self.data_type):
+                checks.append(StructField(child.name, child_check))
+            else:
+                checks.append(ListElements(child_check))
+        if len(checks) > 1:
+            return All(frozenset(checks))
+        return checks[0] if checks else None
 
     def to_pyarrow(self) -> pyarrow.Field:
         """Convert to an PyArrow field."""
@@ -34,4 +85,13 @@ class Field:
             self.name,
             self.data_type,
             nullable=self.nullable,
+            metadata={SORTED_METADATA_KEY: b"true"} if self.sorted else None,
         )
+
+
+def _is_list(data_type: pyarrow.DataType) -> bool:
+    return (
+        pyarrow.types.is_list(data_type)
+        or pyarrow.types.is_large_list(data_type)
+        or pyarrow.types.is_fixed_size_list(data_type)
+    )
@@ -0,0 +1,425 @@
+"""Mergeable, bounded-memory summaries of column values.
+
+These accumulators back the aggregate checks in `iudex.aggregates`. Each
+one summarises any number of values in a fixed amount of memory, and two
+accumulators built from different batches can be merged into one that
+summarises both.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Iterable
+from typing import Any
+
+import numpy
+import pyarrow
+import pyarrow.compute
+
+from .checks import Accumulator, _memory_pool
+
+
+class NullCounter(Accumulator):
+    """Counts values and nulls."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.null_count = 0
+
+    def update(self, values: pyarrow.Array) -> None:
+        self.count += len(values)
+        self.null_count += values.null_count
+
+    def merge(self, other: NullCounter) -> None:
+        self.count += other.count
+        self.null_count += other.null_count
+
+    @property
+    def null_fraction(self) -> float | None:
+        """The fraction of values which are null, if there are any values."""
+        if not self.count:
+            return None
+        return self.null_count / self.count
+
+
+class Moments(Accumulator):
+    """Tracks the count, mean and variance of the non-null values.
+
+    Batches are combined using the parallel form of Welford's algorithm
+    (Chan et al.), which is numerically stable.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._mean = 0.0
+        # The sum of squared differences from the mean.
+        self._m2 = 0.0
+
+    def update(self, values: pyarrow.Array) -> None:
+        values = _to_float64(values)
+        count = len(values) - values.null_count
+        if not count:
+            return
+        mean = pyarrow.compute.mean(values, memory_pool=_memory_pool()).as_py()
+        m2 = (
+            pyarrow.compute.variance(values, ddof=0, memory_pool=_memory_pool()).as_py()
+            * count
+        )
+        self._combine(count, mean, m2)
+
+    def merge(self, other: Moments) -> None:
+        if other.count:
+            self._combine(other.count, other._mean, other._m2)
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        total = self.count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    @property
+    def mean(self) -> float | None:
+        """The mean of the values, if there are any."""
+        return self._mean if self.count else None
+
+    @property
+    def variance(self) -> float | None:
+        """The population variance of the values, if there are any."""
+        return self._m2 / self.count if self.count else None
+
+    @property
+    def standard_deviation(self) -> float | None:
+        """The population standard deviation of the values, if there are any."""
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+
+class MinMax(Accumulator):
+    """Tracks the smallest and largest non-null values."""
+
+    def __init__(self) -> None:
+        self.min: Any = None
+        self.max: Any = None
+
+    def update(self, values: pyarrow.Array) -> None:
+        if pyarrow.types.is_dictionary(values.type):
+            values = values.dictionary_decode()
+        result = pyarrow.compute.min_max(values, memory_pool=_memory_pool())
+        self._combine(result["min"].as_py(), result["max"].as_py())
+
+    def merge(self, other: MinMax) -> None:
+        self._combine(other.min, other.max)
+
+    def _combine(self, low: Any, high: Any) -> None:
+        if low is not None and (self.min is None or low < self.min):
+            self.min = low
+        if high is not None and (self.max is None or high > self.max):
+            self.max = high
+
+
+class ValueSet(Accumulator):
+    """Collects the distinct non-null values, up to ``max_size`` of them.
+
+    Once there are more distinct values than that, they are discarded.
+    """
+
+    def __init__(self, max_size: int = 20) -> None:
+        self.max_size = max_size
+        self._values: set[Any] | None = set()
+
+    def update(self, values: pyarrow.Array) -> None:
+        if self._values is None:
+            return
+        if pyarrow.types.is_dictionary(values.type):
+            values = values.dictionary_decode()
+        distinct = pyarrow.compute.unique(
+            values.drop_null(), memory_pool=_memory_pool()
+        )
+        if len(distinct) > self.max_size:
+            self._values = None
+        else:
+            self._add(distinct.to_pylist())
+
+    def merge(self, other: ValueSet) -> None:
+        if other._values is None:
+            self._values = None
+        else:
+            self._add(other._values)
+
+    def _add(self, values: Iterable[Any]) -> None:
+        if self._values is None:
+            return
+        self._values.update(values)
+        if len(self._values) > self.max_size:
+            self._values = None
+
+    @property
+    def values(self) -> frozenset[Any] | None:
+        """The distinct values, unless there were more than ``max_size``."""
+        return None if self._values is None else frozenset(self._values)
+
+
+class Quantiles(Accumulator):
+    """Estimates quantiles of the non-null, non-NaN values with a KLL sketch.
+
+    The sketch holds ``O(k log(n / k))`` values. Larger ``k`` give more
+    accurate estimates, with a rank error of roughly ``1.7 / k``.
+
+    See Karnin, Lang and Liberty, "Optimal Quantile Approximation in
+    Streams" (2016).
+    """
+
+    def __init__(self, k: int = 200, seed: int | None = None) -> None:
+        if k < 2:
+            raise ValueError("k must be at least 2.")
+        self.k = k
+        self.count = 0
+        # Level `i` holds values which each stand for `2 ** i` inputs.
+        self._levels: list[numpy.ndarray] = [numpy.empty(0)]
+        self._rng = numpy.random.default_rng(seed)
+
+    def update(self, values: pyarrow.Array) -> None:
+        array = _to_numpy(values)
+        array = array[~numpy.isnan(array)]
+        self.count += len(array)
+        self._levels[0] = numpy.concatenate([self._levels[0], array])
+        self._compact()
+
+    def merge(self, other: Quantiles) -> None:
+        for level, items in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(numpy.empty(0))
+            self._levels[level] = numpy.concatenate([self._levels[level], items])
+        self.count += other.count
+        self._compact()
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the ``q``-th quantile of the values, if there are any."""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+        if not self.count:
+            return None
+        items = numpy.concatenate(self._levels)
+        weights = numpy.concatenate(
+            [
+                numpy.full(len(level_items), 2**level)
+                for level, level_items in enumerate(self._levels)
+            ],
+        )
+        order = numpy.argsort(items, kind="stable")
+        ranks = numpy.cumsum(weights[order])
+        index = numpy.searchsorted(ranks, q * ranks[-1], side="left")
+        return float(items[order[min(index, len(items) - 1)]])
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(math.ceil(self.k * (2 / 3) ** depth), 2)
+
+    def _compact(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(numpy.empty(0))
+                items = numpy.sort(items)
+                # Keep one value behind if there is an odd number of them,
+                # then promote every other value, starting at random.
+                odd = len(items) % 2
+                promoted = items[odd + int(self._rng.integers(2)) :: 2]
+                self._levels[level] = items[:odd]
+                self._levels[level + 1] = numpy.concatenate(
+                    [self._levels[level + 1], promoted],
+                )
+            level += 1
+
+
+class DistinctCounter(Accumulator):
+    """Estimates the number of distinct non-null values with HyperLogLog.
+
+    The sketch holds ``2 ** precision`` one-byte registers and has a
+    relative standard error of roughly ``1.04 / sqrt(2 ** precision)``.
+    Values are hashed with vectorised NumPy operations, except those of
+    types other than numbers, times, strings and binary, whose distinct
+    values in each batch are hashed one at a time in Python.
+
+    See Flajolet et al., "HyperLogLog: the analysis of a near-optimal
+    cardinality estimation algorithm" (2007).
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("Precision must be between 4 and 18.")
+        self.precision = precision
+        self._registers = numpy.zeros(2**precision, dtype=numpy.uint8)
+
+    def update(self, values: pyarrow.Array) -> None:
+        hashes = _hash(values)
+        if not len(hashes):
+            return
+        index = hashes >> numpy.uint64(64 - self.precision)
+        # The rank is the position of the leftmost set bit in the remaining
+        # bits, counting from one.
+        remaining = hashes & numpy.uint64((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision + 1) - _bit_length(remaining)
+        numpy.maximum.at(self._registers, index, rank.astype(numpy.uint8))
+
+    def merge(self, other: DistinctCounter) -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precisions.")
+        numpy.maximum(self._registers, other._registers, out=self._registers)
+
+    @property
+    def distinct_count(self) -> int:
+        """The estimated number of distinct values."""
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = (
+            alpha * m * m / numpy.sum(numpy.ldexp(1.0, -self._registers.astype(int)))
+        )
+        zeros = int(numpy.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+
+def _to_float64(values: pyarrow.Array) -> pyarrow.Array:
+    if pyarrow.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    if pyarrow.types.is_interval(values.type):
+        raise TypeError(f"Cannot summarise {values.type} values as numbers.")
+    if pyarrow.types.is_temporal(values.type):
+        values = _to_int64(values)
+    return values.cast(pyarrow.float64(), safe=False, memory_pool=_memory_pool())
+
+
+def _to_int64(values: pyarrow.Array) -> pyarrow.Array:
+    """Cast temporal values to the integers which represent them.
+
+    Arrow only casts dates and times to integers of the same width.
+    """
+    if values.type.bit_width == 32:
+        values = values.cast(pyarrow.int32(), memory_pool=_memory_pool())
+    return values.cast(pyarrow.int64(), memory_pool=_memory_pool())
+
+
+def _to_numpy(values: pyarrow.Array) -> numpy.ndarray:
+    """Convert the non-null values to a float64 NumPy array."""
+    return _to_float64(values).drop_null().to_numpy(zero_copy_only=False)
+
+
+def _hash(values: pyarrow.Array) -> numpy.ndarray:
+    """Hash the non-null values to 64 bits, consistently across processes.
+
+    Numbers, times and binary or string values are hashed with vectorised
+    NumPy operations, the latter in time proportional to their total length.
+    Each distinct value of any other type is hashed in a Python loop, which
+    is far slower.
+    """
+    if pyarrow.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    values = values.drop_null()
+    value_type = values.type
+    if pyarrow.types.is_floating(value_type):
+        bits = values.cast(pyarrow.float64(), memory_pool=_memory_pool()).to_numpy(
+            zero_copy_only=False
+        )
+        return _mix(bits.view(numpy.uint64))
+    if pyarrow.types.is_integer(value_type) or pyarrow.types.is_boolean(value_type):
+        # An unsafe cast keeps the bits of unsigned 64-bit integers which do
+        # not fit in a signed one.
+        bits = values.cast(
+            pyarrow.int64(), safe=False, memory_pool=_memory_pool()
+        ).to_numpy(zero_copy_only=False)
+        return _mix(bits.view(numpy.uint64))
+    if pyarrow.types.is_temporal(value_type) and not pyarrow.types.is_interval(
+        value_type,
+    ):
+        bits = _to_int64(values).to_numpy(zero_copy_only=False)
+        return _mix(bits.view(numpy.uint64))
+    if pyarrow.types.is_string(value_type) or pyarrow.types.is_binary(value_type):
+        return _hash_bytes(
+            values.cast(pyarrow.binary(), memory_pool=_memory_pool()), numpy.int32
+        )
+    if pyarrow.types.is_large_string(value_type) or pyarrow.types.is_large_binary(
+        value_type,
+    ):
+        return _hash_bytes(
+            values.cast(pyarrow.large_binary(), memory_pool=_memory_pool()), numpy.int64
+        )
+    # Hash other types one distinct value at a time.
+    digests = [
+        hashlib.blake2b(
+            value if isinstance(value, bytes) else str(value).encode(),
+            digest_size=8,
+        ).digest()
+        for value in pyarrow.compute.unique(
+            values, memory_pool=_memory_pool()
+        ).to_pylist()
+    ]
+    return numpy.frombuffer(b"".join(digests), dtype=numpy.uint64)
+
+
+def _hash_bytes(
+    values: pyarrow.Array,
+    offset_type: type[numpy.integer[Any]],
+) -> numpy.ndarray:
+    """Hash binary values without nulls from their offsets and data buffers.
+
+    Each byte is mixed with its position in its value, and the results are
+    combined per value with exclusive or, then mixed with the value's length.
+    """
+    combined = numpy.zeros(len(values), dtype=numpy.uint64)
+    if not len(values):
+        return combined
+    _, offsets_buffer, data_buffer = values.buffers()
+    offsets = numpy.frombuffer(offsets_buffer, dtype=offset_type)[
+        values.offset : values.offset + len(values) + 1
+    ].astype(numpy.int64)
+    lengths = numpy.diff(offsets)
+    if offsets[-1] > offsets[0]:
+        data = numpy.frombuffer(data_buffer, dtype=numpy.uint8)[
+            offsets[0] : offsets[-1]
+        ]
+        starts = offsets[:-1] - offsets[0]
+        positions = numpy.arange(len(data), dtype=numpy.uint64) - numpy.repeat(
+            starts.astype(numpy.uint64),
+            lengths,
+        )
+        mixed = _mix(data.astype(numpy.uint64) | (positions << numpy.uint64(8)))
+        nonempty = lengths > 0
+        combined[nonempty] = numpy.bitwise_xor.reduceat(mixed, starts[nonempty])
+    return _mix(combined ^ _mix(lengths.astype(numpy.uint64)))
+
+
+def _hash_each(values: pyarrow.Array) -> numpy.ndarray:
+    """Hash each non-null value to 64 bits, so equal values have equal hashes."""
+    if pyarrow.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    encoded = pyarrow.compute.dictionary_encode(
+        values.drop_null(), memory_pool=_memory_pool()
+    )
+    # Each distinct value is hashed once, then the hashes are taken through
+    # the indices.
+    return _hash(encoded.dictionary)[encoded.indices.to_numpy(zero_copy_only=False)]
+
+
+def _mix(bits: numpy.ndarray) -> numpy.ndarray:
+    """The SplitMix64 finaliser, which spreads similar inputs across all bits."""
+    bits = bits + numpy.uint64(0x9E3779B97F4A7C15)
+    bits = (bits ^ (bits >> numpy.uint64(30))) * numpy.uint64(0xBF58476D1CE4E5B9)
+    bits = (bits ^ (bits >> numpy.uint64(27))) * numpy.uint64(0x94D049BB133111EB)
+    return bits ^ (bits >> numpy.uint64(31))
+
+
+def _bit_length(bits: numpy.ndarray) -> numpy.ndarray:
+    length = numpy.zeros(len(bits), dtype=numpy.int64)
+    bits = bits.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = bits >= numpy.uint64(1 << shift)
+        length[high] += shift
+        bits[high] >>= numpy.uint64(shift)
+    return length + (bits > 0)
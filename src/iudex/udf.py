@@ -0,0 +1,117 @@
+"""User-defined elementwise checks, run as Arrow compute functions.
+
+A vectorised function which checks an array of values is registered as an
+Arrow scalar function with `pyarrow.compute.register_scalar_function`. The
+resulting check runs one batch at a time alongside the built-in checks,
+and can also be used in Arrow expressions, for example to filter a
+Dataset or in an Acero plan.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Callable
+from typing import Any
+
+import pyarrow
+import pyarrow.compute
+
+from .checks import ElementwiseCheck, _memory_pool
+
+
+@dataclasses.dataclass(frozen=True)
+class UserDefinedCheck(ElementwiseCheck):
+    """A check which calls a registered Arrow scalar function.
+
+    The function must take a single array of ``input_type`` and return a
+    boolean array. Values of other types are cast to ``input_type``.
+    """
+
+    function_name: str
+    input_type: pyarrow.DataType
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        if values.type != self.input_type:
+            values = values.cast(self.input_type, memory_pool=_memory_pool())
+        return pyarrow.compute.call_function(
+            self.function_name, [values], memory_pool=_memory_pool()
+        )
+
+    def expression(self, column: str) -> pyarrow.compute.Expression:
+        """An expression applying the check to ``column``."""
+        field = pyarrow.compute.field(column).cast(self.input_type)
+        return pyarrow.compute.Expression._call(self.function_name, [field])
+
+    def __call__(
+        self,
+        data: pyarrow.Table | pyarrow.dataset.Dataset,
+        column: str,
+    ) -> pyarrow.ChunkedArray:
+        if isinstance(data, pyarrow.Table):
+            return super().__call__(data, column)
+        # Project the expression so that the scanner's worker threads
+        # evaluate the function as they read each batch.
+        return data.to_table(
+            columns={"result": self.expression(column)},
+            use_threads=True,
+        ).column("result")
+
+
+def register_check(
+    name: str,
+    input_type: pyarrow.DataType,
+    *,
+    numpy: bool = False,
+    description: str | None = None,
+) -> Callable[[Callable[[Any], Any]], UserDefinedCheck]:
+    """Register a vectorised function as a check.
+
+    Use as a decorator::
+
+        @register_check("is_even", pyarrow.int64())
+        def is_even(values: pyarrow.Array) -> pyarrow.Array:
+            return pyarrow.compute.equal(pyarrow.compute.bit_wise_and(values, 1), 0)
+
+    The function receives a batch of values as a PyArrow array, or as a
+    NumPy array if ``numpy`` is true, and must return a boolean array of
+    the same length. Whatever the function returns for null values, the
+    check's result for them is null. The function is registered under
+    ``name`` in PyArrow's global function registry, so the name must not
+    already be in use.
+    """
+
+    def decorator(function: Callable[[Any], Any]) -> UserDefinedCheck:
+        def kernel(context: Any, values: pyarrow.Array) -> pyarrow.Array:
+            result = function(
+                values.to_numpy(zero_copy_only=False) if numpy else values,
+            )
+            # Arrow gives the kernel the memory pool of the call.
+            pool = context.memory_pool
+            result = pyarrow.array(result, type=pyarrow.bool_(), memory_pool=pool)
+            if values.null_count:
+                result = pyarrow.compute.if_else(
+                    pyarrow.compute.is_valid(values, memory_pool=pool),
+                    result,
+                    None,
+                    memory_pool=pool,
+                )
+            return result
+
+        try:
+            pyarrow.compute.register_scalar_function(
+                kernel,
+                name,
+                {
+                    "summary": f"iudex check {name!r}.",
+                    "description": description or function.__doc__ or "",
+                },
+                {"values": input_type},
+                pyarrow.bool_(),
+            )
+        except pyarrow.ArrowKeyError:
+            raise ValueError(
+                f"A function named {name!r} is already registered.",
+            ) from None
+        return UserDefinedCheck(name, input_type)
+
+    return decorator
@@ -1,61 +1,623 @@
-from typing import TypeVar
+from __future__ import annotations
+
+import dataclasses
+import functools
+import math
+import os
+import threading
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, TypeVar, Union
 
 import pyarrow
-import pyarrow.compute
-import pyarrow.dataset
-import pyarrow.interchange
 
+from .arrow_protocol import ArrowExportable
+from .checks import (
+    Accumulator,
+    AggregateCheck,
+    All,
+    Check,
+    ElementwiseCheck,
+    PerPartition,
+    Unique,
+    _memory_pool,
+    _use_memory_pool,
+)
 from .dataframe_protocol import DataFrame
-from .schema import Schema
 from .errors import SchemaError, ValidationError
+from .scan import MemoryBudget, Progress, Tracker, scan
+from .schema import SORTED_METADATA_KEY, Schema
+
+# The pyarrow submodules used here are slow to import, so they are imported
+# only by the functions which need them.
+if TYPE_CHECKING:
+    import pyarrow.dataset
+
+_PathT = Union[str, "os.PathLike[str]"]
+
+_FORMATS_BY_EXTENSION = {
+    ".arrow": "ipc",
+    ".csv": "csv",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+# A rough multiple of a column's size needed by the hash tables of Unique.
+_UNIQUE_MEMORY_FACTOR = 4
+# The width assumed for values of variable-width types.
+_VARIABLE_WIDTH_BYTES = 32
+# The most partitions Unique is split into to fit within a memory limit.
+_MAX_UNIQUE_PARTITIONS = 256
 
 _ArrowT = TypeVar(
     "_ArrowT",
     pyarrow.Table,
     pyarrow.RecordBatch,
-    pyarrow.dataset.Dataset,
+    "pyarrow.dataset.Dataset",
 )
 
 
 def validate_dataframe(
-    dataframe: DataFrame,
+    dataframe: ArrowExportable | DataFrame,
     schema: Schema,
     allow_copy: bool = True,
+    memory_pool: pyarrow.MemoryPool | None = None,
+    memory_limit: int | None = None,
 ) -> None:
-    """Validate a DataFrame against a schema."""
-    table = pyarrow.interchange.from_dataframe(
+    """Validate a DataFrame against a schema.
+
+    Objects implementing the Arrow PyCapsule interface (``__arrow_c_stream__``
+    or ``__arrow_c_array__``) are imported through it, keeping the chunking
+    of streams. Arrow does not copy the data it is given, but producers may
+    copy to export it, as pandas does. Anything else is converted through
+    the DataFrame interchange protocol, which may copy.
+
+    If ``allow_copy`` is ``False``, objects implementing the interchange
+    protocol are always converted through it, which raises if that needs a
+    copy. Objects which only implement the PyCapsule interface cannot be
+    asked not to copy, so ``allow_copy`` does not apply to them.
+
+    See `validate_many` for ``memory_pool`` and ``memory_limit``.
+    """
+    validate_pyarrow(
+        _to_pyarrow(dataframe, allow_copy=allow_copy),
+        schema,
+        memory_pool=memory_pool,
+        memory_limit=memory_limit,
+    )
+
+
+def _to_pyarrow(
+    dataframe: ArrowExportable | DataFrame,
+    allow_copy: bool,
+) -> pyarrow.Table | pyarrow.RecordBatch:
+    # Only the interchange protocol can refuse to copy.
+    if allow_copy or not hasattr(dataframe, "__dataframe__"):
+        if hasattr(dataframe, "__arrow_c_stream__"):
+            # Importing the stream moves ownership of the producer's buffers
+            # to Arrow, so collecting the batches keeps their chunking and
+            # does not copy them again.
+            return pyarrow.RecordBatchReader.from_stream(dataframe).read_all()
+        if hasattr(dataframe, "__arrow_c_array__"):
+            return pyarrow.record_batch(dataframe)
+
+    from pyarrow.interchange import from_dataframe
+
+    return from_dataframe(
         dataframe,
         allow_copy=allow_copy,
     )
-    validate_pyarrow(table, schema)
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationResult:
+    """The outcome of validating data against a schema."""
+
+    schema: Schema
+    # Why the data's schema does not match, if it does not.
+    schema_error: str | None = None
+    failed_fields: tuple[str, ...] = ()
+    # The most memory allocated during validation, in bytes. See
+    # `validate_many`.
+    peak_memory: int = 0
+    # Why validation stopped before covering all of the data, if it did:
+    # "cancelled", "timeout", "max_rows" or "max_bytes".
+    stopped: str | None = None
+    # Fields which have not failed, but whose checks were not evaluated over
+    # all of the data because validation stopped early.
+    unchecked_fields: tuple[str, ...] = ()
+    progress: Progress = dataclasses.field(default_factory=Progress)
+    # The partitions which fail `PerPartition` checks, by field name.
+    failed_partitions: Mapping[str, tuple[str, ...]] = dataclasses.field(
+        default_factory=dict,
+    )
+
+    @property
+    def complete(self) -> bool:
+        """Whether every check was evaluated over all of the data."""
+        return not self.unchecked_fields
+
+    @property
+    def passed(self) -> bool:
+        return self.schema_error is None and not self.failed_fields and self.complete
+
+    def raise_for_failure(self) -> None:
+        """Raise a SchemaError or ValidationError if validation failed.
+
+        Nothing is raised for fields which were left unchecked.
+        """
+        if self.schema_error is not None:
+            raise SchemaError(self.schema_error)
+        if self.failed_fields:
+            raise ValidationError(
+                f"Check failed for field {self.failed_fields[0]!r}.",
+            )
 
 
 def validate_pyarrow(
     data: _ArrowT,
     schema: Schema,
+    use_threads: bool = True,
+    memory_pool: pyarrow.MemoryPool | None = None,
+    memory_limit: int | None = None,
 ) -> _ArrowT:
-    """Validate a Table against a schema."""
-    # Convert to a dataset if necessary so that we can focus on
-    # one API for validation.
-    if isinstance(data, pyarrow.dataset.Dataset):
-        dataset = data
+    """Validate a Table, RecordBatch or Dataset against a schema.
+
+    Elementwise and aggregate checks are evaluated together in a single
+    pass over the data, other checks scan the data themselves. See
+    `validate_many` for ``memory_pool`` and ``memory_limit``.
+    """
+    (result,) = validate_many(data, [schema], use_threads, memory_pool, memory_limit)
+    result.raise_for_failure()
+    return data
+
+
+def validate_many(
+    data: pyarrow.Table | pyarrow.RecordBatch | pyarrow.dataset.Dataset,
+    schemas: Sequence[Schema],
+    use_threads: bool = True,
+    memory_pool: pyarrow.MemoryPool | None = None,
+    memory_limit: int | None = None,
+    *,
+    timeout: float | None = None,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+    cancel: threading.Event | None = None,
+    progress: Callable[[Progress], None] | None = None,
+) -> list[ValidationResult]:
+    """Validate a Table, RecordBatch or Dataset against several schemas.
+
+    The checks of every schema are evaluated in the same pass over the
+    data, and a check used on the same field by several schemas is only
+    evaluated once. Returns a result for each schema, in order.
+
+    Datasets are read into ``memory_pool``, the default memory pool if not
+    given, and the built-in checks' compute kernels allocate from it too.
+    Acero, which runs `Unique` and finds the partitions of `PerPartition`,
+    always allocates from the default memory pool, so that is tracked as
+    well, without counting memory twice if ``memory_pool`` allocates from
+    it too. The peak memory allocated is reported in each result. It is
+    taken from the pools' own peaks, so it includes memory allocated and
+    freed within a check, such as `Unique`'s hash table. The checks
+    allocate from a proxy of a given ``memory_pool``, made for each call,
+    whose peak only covers that call. The peaks of the pools themselves
+    only show memory which was allocated and freed once they are higher
+    than they had already reached before validation.
+
+    If ``memory_limit`` is given, Datasets are read with less readahead and
+    `Unique` checks which are estimated not to fit in the remaining memory
+    are split into partitions which are checked one at a time. If more than
+    ``memory_limit`` bytes are allocated anyway, a MemoryLimitError is
+    raised.
+
+    Validation stops early once ``timeout`` seconds have passed, once
+    ``max_rows`` rows or ``max_bytes`` bytes have been read by the pass over
+    the data while more remains, or once ``cancel`` is set from another
+    thread. It stops between batches and between checks which scan the
+    data themselves, but does not interrupt those checks. The row and byte
+    limits do not stop those checks once the pass has read all of the
+    data. Fields which were not fully checked are then listed in each
+    result's ``unchecked_fields``. After each batch and each check,
+    ``progress`` is called with the data covered so far, one call at a
+    time.
+    """
+    if memory_limit is not None and memory_limit <= 0:
+        raise ValueError("memory_limit must be positive.")
+    budget = MemoryBudget(memory_pool, memory_limit)
+    tracker = Tracker(budget, timeout, max_rows, max_bytes, cancel, progress)
+
+    # Checks accept either a Table or a Dataset. Tables are not converted
+    # to Datasets since `pyarrow.dataset` is slow to import.
+    if isinstance(data, pyarrow.RecordBatch):
+        source = pyarrow.Table.from_batches([data])
     else:
-        dataset = pyarrow.dataset.dataset(data)
+        source = data
 
-    target_schema = schema.to_pyarrow()
+    schema_errors: list[str | None] = []
+    for schema in schemas:
+        target_schema = schema.to_pyarrow()
+        if source.schema == target_schema:
+            schema_errors.append(None)
+        else:
+            schema_errors.append(
+                f"Schema does not match expected schema.\n"
+                f"Schema: {data.schema!r}.\n"
+                f"Expected schema: {target_schema!r}.",
+            )
 
-    if dataset.schema != target_schema:
-        raise SchemaError(
-            f"Schema does not match expected schema.\n"
-            f"Schema: {data.schema!r}.\n"
-            f"Expected schema: {target_schema!r}.",
+    matching = [
+        schema for schema, error in zip(schemas, schema_errors) if error is None
+    ]
+    try:
+        with _use_memory_pool(budget.pool):
+            outcomes = iter(_failed_fields(source, matching, use_threads, tracker))
+    finally:
+        budget.close()
+    results = []
+    for schema, error in zip(schemas, schema_errors):
+        if error is not None:
+            results.append(
+                ValidationResult(schema, schema_error=error, peak_memory=budget.peak),
+            )
+            continue
+        failed, unchecked, failed_partitions = next(outcomes)
+        results.append(
+            ValidationResult(
+                schema,
+                failed_fields=failed,
+                failed_partitions=failed_partitions,
+                peak_memory=budget.peak,
+                stopped=tracker.stopped,
+                unchecked_fields=unchecked,
+                progress=tracker.progress,
+            ),
         )
+    return results
 
-    for field in schema.fields:
-        if field.check is not None:
-            if not pyarrow.compute.max(field.check(dataset, field.name)).as_py():
-                raise ValidationError(
-                    f"Check failed for field {field.name!r}.",
-                )
 
-    return data
+# A field's check, identified by the field's name and the check itself so
+# that identical checks in different schemas are only evaluated once.
+_CheckKey = tuple[str, object]
+
+
+def _check_key(name: str, check: Check) -> _CheckKey:
+    try:
+        hash(check)
+    except TypeError:
+        return name, id(check)
+    return name, check
+
+
+def _failed_fields(
+    source: pyarrow.Table | pyarrow.dataset.Dataset,
+    schemas: Sequence[Schema],
+    use_threads: bool,
+    tracker: Tracker,
+) -> list[tuple[tuple[str, ...], tuple[str, ...], dict[str, tuple[str, ...]]]]:
+    """Run the checks of each schema.
+
+    Returns the fields of each schema which fail, those which have not
+    failed but were not fully checked, and the partitions which fail
+    `PerPartition` checks by field.
+    """
+    import pyarrow.compute
+
+    # The checks of each field of each schema.
+    field_keys: list[dict[str, list[_CheckKey]]] = []
+    # Where each distinct check is used, as (schema index, field name) pairs.
+    users: dict[_CheckKey, list[tuple[int, str]]] = {}
+    elementwise: dict[_CheckKey, Check] = {}
+    aggregate: dict[_CheckKey, AggregateCheck[Accumulator]] = {}
+    other: dict[_CheckKey, Check] = {}
+
+    # Whether the data records each column as sorted, found at most once
+    # since it may read the footer of every Parquet file.
+    @functools.cache
+    def recorded_sorted(name: str) -> bool:
+        return _recorded_sorted(source, name)
+
+    for i, schema in enumerate(schemas):
+        keys: dict[str, list[_CheckKey]] = {}
+        for field in schema.fields:
+            nested_check = field.nested_check()
+            if nested_check is None:
+                continue
+            for check in _conjuncts(nested_check):
+                if (
+                    isinstance(check, Unique)
+                    and not check.presorted
+                    and (field.sorted or recorded_sorted(field.name))
+                ):
+                    check = dataclasses.replace(check, presorted=True)
+                key = _check_key(field.name, check)
+                keys.setdefault(field.name, []).append(key)
+                users.setdefault(key, []).append((i, field.name))
+                if check.is_elementwise():
+                    elementwise.setdefault(key, check)
+                elif isinstance(check, AggregateCheck):
+                    aggregate.setdefault(key, check)
+                else:
+                    other.setdefault(key, check)
+        field_keys.append(keys)
+
+    def field_failed(i: int, name: str) -> bool:
+        return any(key in failed for key in field_keys[i].get(name, ()))
+
+    def field_unchecked(i: int, name: str) -> bool:
+        return not field_failed(i, name) and any(
+            key not in checked for key in field_keys[i].get(name, ())
+        )
+
+    def field_failed_partitions(i: int, name: str) -> tuple[str, ...]:
+        labels = (
+            label
+            for key in field_keys[i][name]
+            for label in failed_partitions.get(key, ())
+        )
+        return tuple(dict.fromkeys(labels))
+
+    failed: set[_CheckKey] = set()
+    # The labels of the partitions which fail each `PerPartition` check.
+    failed_partitions: dict[_CheckKey, tuple[str, ...]] = {}
+    # Checks which have been evaluated over all of the data.
+    checked: set[_CheckKey] = set()
+    tracker.progress = dataclasses.replace(tracker.progress, total_checks=len(other))
+    if elementwise or aggregate:
+        scan_failed, accumulators, complete = scan(
+            source,
+            elementwise,
+            {key: check.accumulator for key, check in aggregate.items()},
+            use_threads,
+            tracker,
+        )
+        failed.update(scan_failed)
+        if complete:
+            # Aggregate checks are only evaluated if all of the data was
+            # summarised.
+            for key, check in aggregate.items():
+                if not check.passes(accumulators[key]):
+                    failed.add(key)
+            checked.update(elementwise)
+            checked.update(aggregate)
+    for key, check in other.items():
+        # Skip checks whose outcome cannot change any result. The partitions
+        # failing `PerPartition` checks are part of the results.
+        if not isinstance(check, PerPartition) and all(
+            field_failed(i, name) for i, name in users[key]
+        ):
+            continue
+        # The row and byte limits only bound the pass over the data, which
+        # has already stopped if it reached them.
+        if tracker.should_stop(read_limits=False):
+            break
+        check = _fit_to_budget(check, source, key[0], tracker.memory)
+        if isinstance(check, PerPartition):
+            failed_partitions[key] = tuple(
+                label
+                for label, result in check.partition_results(source, key[0]).items()
+                if not pyarrow.compute.all(
+                    result,
+                    memory_pool=tracker.memory.pool,
+                ).as_py()
+            )
+            if failed_partitions[key]:
+                failed.add(key)
+        elif not pyarrow.compute.all(
+            check(source, key[0]),
+            memory_pool=tracker.memory.pool,
+        ).as_py():
+            failed.add(key)
+        checked.add(key)
+        tracker.memory.sample()
+        tracker.update(checks=1)
+
+    return [
+        (
+            tuple(field.name for field in schema.fields if field_failed(i, field.name)),
+            tuple(
+                field.name for field in schema.fields if field_unchecked(i, field.name)
+            ),
+            {
+                name: labels
+                for name in field_keys[i]
+                if (labels := field_failed_partitions(i, name))
+            },
+        )
+        for i, schema in enumerate(schemas)
+    ]
+
+
+def _recorded_sorted(
+    source: pyarrow.Table | pyarrow.dataset.Dataset,
+    name: str,
+) -> bool:
+    """Whether the data records a column as sorted.
+
+    Columns are sorted if the data's schema has the sorted metadata, or if
+    every row group of a Parquet Dataset is sorted by the column first.
+    """
+    metadata = source.schema.field(name).metadata or {}
+    if metadata.get(SORTED_METADATA_KEY) == b"true":
+        return True
+    if isinstance(source, pyarrow.Table):
+        return False
+
+    from pyarrow.dataset import FileSystemDataset, ParquetFileFormat
+
+    if (
+        not isinstance(source, FileSystemDataset)
+        or not isinstance(source.format, ParquetFileFormat)
+        or source._scan_options.get("filter") is not None
+    ):
+        return False
+    # Parquet only records the order within each row group. Unique checks
+    # the order across row groups as it goes.
+    any_fragments = False
+    for fragment in source.get_fragments():
+        any_fragments = True
+        metadata = fragment.metadata
+        for i in range(metadata.num_row_groups):
+            sorting_columns = metadata.row_group(i).sorting_columns
+            if (
+                not sorting_columns
+                or metadata.schema.column(sorting_columns[0].column_index).path != name
+            ):
+                return False
+    return any_fragments
+
+
+def _fit_to_budget(
+    check: Check,
+    source: pyarrow.Table | pyarrow.dataset.Dataset,
+    column: str,
+    budget: MemoryBudget,
+) -> Check:
+    """Partition a Unique check if it is not expected to fit in memory."""
+    remaining = budget.remaining
+    if remaining is None or not isinstance(check, Unique):
+        return check
+    needed = _unique_memory(source, column) // check.num_partitions
+    if needed <= remaining:
+        return check
+    num_partitions = check.num_partitions * math.ceil(needed / max(remaining, 1))
+    return dataclasses.replace(
+        check,
+        num_partitions=min(num_partitions, _MAX_UNIQUE_PARTITIONS),
+    )
+
+
+def _unique_memory(
+    source: pyarrow.Table | pyarrow.dataset.Dataset,
+    column: str,
+) -> int:
+    """Roughly estimate the memory Unique needs to check a column."""
+    if isinstance(source, pyarrow.Table):
+        nbytes = source.column(column).nbytes
+    else:
+        data_type = source.schema.field(column).type
+        try:
+            width = max(data_type.bit_width // 8, 1)
+        except ValueError:
+            width = _VARIABLE_WIDTH_BYTES
+        nbytes = source.count_rows() * width
+    return nbytes * _UNIQUE_MEMORY_FACTOR
+
+
+def _conjuncts(check: Check) -> Iterator[Check]:
+    """Split a check into checks which must all pass."""
+    if isinstance(check, All):
+        for child in check.checks:
+            yield from _conjuncts(child)
+    else:
+        yield check
+
+
+def validate_file(
+    path_or_paths: _PathT | Sequence[_PathT],
+    schema: Schema,
+    format: str | None = None,
+    use_threads: bool = True,
+    memory_pool: pyarrow.MemoryPool | None = None,
+    memory_limit: int | None = None,
+) -> pyarrow.dataset.Dataset:
+    """Validate Arrow IPC/Feather, Parquet or CSV files against a schema.
+
+    Arrow IPC files are memory-mapped so that uncompressed files are
+    validated without reading them into memory. Only the columns needed by
+    each check are read from Parquet files. CSV files are parsed using the
+    types in ``schema``, so their columns are only compared by name, and
+    fields which are not nullable are checked to have no nulls.
+
+    If ``format`` is not given, it is inferred from the file extension.
+    See `validate_many` for ``memory_pool`` and ``memory_limit``. Returns
+    the validated files as a Dataset.
+    """
+    if isinstance(path_or_paths, (str, os.PathLike)):
+        paths = [os.path.abspath(path_or_paths)]
+    else:
+        paths = [os.path.abspath(path) for path in path_or_paths]
+    if not paths:
+        raise ValueError("At least one path must be given.")
+
+    import pyarrow.dataset
+    import pyarrow.fs
+
+    if format is None:
+        format = _infer_format(paths[0])
+
+    filesystem = pyarrow.fs.LocalFileSystem(
+        use_mmap=format in ("ipc", "feather", "arrow")
+    )
+    dataset = pyarrow.dataset.dataset(
+        paths if len(paths) > 1 else paths[0],
+        # CSV files carry no type information of their own.
+        schema=schema.to_pyarrow() if format == "csv" else None,
+        format=format,
+        filesystem=filesystem,
+    )
+    if format == "csv":
+        _check_csv_columns(dataset, schema)
+        schema = _with_nulls_checked(schema)
+    return validate_pyarrow(dataset, schema, use_threads, memory_pool, memory_limit)
+
+
+def _check_csv_columns(dataset: pyarrow.dataset.Dataset, schema: Schema) -> None:
+    """Raise a SchemaError if a CSV file's columns are not the schema's.
+
+    A CSV Dataset read with a schema fills missing columns with nulls and
+    ignores extra ones, so each file's header is read to compare them.
+    """
+    import pyarrow.csv
+
+    expected = [field.name for field in schema.fields]
+    for path in dataset.files:
+        with dataset.filesystem.open_input_stream(path) as file:
+            names = pyarrow.csv.open_csv(file).schema.names
+        if names != expected:
+            raise SchemaError(
+                f"Columns of {path!r} do not match expected columns.\n"
+                f"Columns: {names!r}.\n"
+                f"Expected columns: {expected!r}.",
+            )
+
+
+def _with_nulls_checked(schema: Schema) -> Schema:
+    """Check the fields of a schema which are not nullable for nulls."""
+    return dataclasses.replace(
+        schema,
+        fields=[
+            field
+            if field.nullable
+            else dataclasses.replace(
+                field,
+                check=_IsValid() if field.check is None else field.check & _IsValid(),
+            )
+            for field in schema.fields
+        ],
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class _IsValid(ElementwiseCheck):
+    """Values are not null."""
+
+    def evaluate(self, values: pyarrow.Array) -> pyarrow.Array:
+        import pyarrow.compute
+
+        return pyarrow.compute.is_valid(values, memory_pool=_memory_pool())
+
+
+def _infer_format(path: str) -> str:
+    if os.path.isdir(path):
+        raise ValueError(
+            f"Cannot infer the file format of directory {path!r}, "
+            f"pass `format` explicitly.",
+        )
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        return _FORMATS_BY_EXTENSION[extension]
+    except KeyError:
+        raise ValueError(
+            f"Cannot infer the file format of {path!r}, pass `format` explicitly.",
+        ) from None
@@ -0,0 +1,150 @@
+import pyarrow
+import pyarrow.dataset
+import pytest
+
+import iudex.aggregates
+import iudex.checks
+import iudex.errors
+import iudex.schema
+import iudex.validate
+
+
+def make_dataset(data):
+    return pyarrow.dataset.dataset(
+        pyarrow.table({"a": data}),
+    )
+
+
+def test_mean():
+    check = iudex.aggregates.Mean(lower=1, upper=3)
+
+    ds = make_dataset([1, 2, 3])
+    assert check(ds, "a").to_pylist() == [True, True, True]
+
+    ds = make_dataset([1, 2, 30])
+    assert check(ds, "a").to_pylist() == [False, False, False]
+
+    ds = make_dataset(pyarrow.array([None, None], pyarrow.int64()))
+    assert check(ds, "a").to_pylist() == [True, True]
+
+
+def test_standard_deviation():
+    check = iudex.aggregates.StandardDeviation(upper=1)
+
+    ds = make_dataset([1.0, 1.5, 2.0])
+    assert check(ds, "a").to_pylist() == [True, True, True]
+
+    ds = make_dataset([1.0, 10.0, 2.0])
+    assert check(ds, "a").to_pylist() == [False, False, False]
+
+
+def test_quantile():
+    check = iudex.aggregates.Quantile(0.99, upper=100)
+
+    ds = make_dataset(list(range(100)))
+    assert all(check(ds, "a").to_pylist())
+
+    ds = make_dataset(list(range(1000)))
+    assert not any(check(ds, "a").to_pylist())
+
+
+def test_null_fraction():
+    check = iudex.aggregates.NullFraction(upper=0.5)
+
+    ds = make_dataset([1, None, 3])
+    assert check(ds, "a").to_pylist() == [True, True, True]
+
+    ds = make_dataset([1, None, None])
+    assert check(ds, "a").to_pylist() == [False, False, False]
+
+
+def test_distinct_count():
+    check = iudex.aggregates.DistinctCount(lower=2, upper=3)
+
+    ds = make_dataset(["a", "b", "b", "c"])
+    assert check(ds, "a").to_pylist() == [True, True, True, True]
+
+    ds = make_dataset(["a", "a", "a"])
+    assert check(ds, "a").to_pylist() == [False, False, False]
+
+
+@pytest.mark.parametrize(
+    "check",
+    [
+        iudex.aggregates.Mean(lower=1, upper=3),
+        iudex.aggregates.StandardDeviation(upper=1),
+        iudex.aggregates.Quantile(0.5, lower=1, upper=3),
+        iudex.aggregates.DistinctCount(lower=3, upper=3),
+    ],
+)
+@pytest.mark.parametrize(
+    "data_type",
+    [pyarrow.date32(), pyarrow.time32("s"), pyarrow.time64("us")],
+)
+def test_temporal(check, data_type):
+    values = pyarrow.array([1, 2, 3, None], pyarrow.int32())
+    if data_type.bit_width == 64:
+        values = values.cast(pyarrow.int64())
+    ds = make_dataset(values.cast(data_type))
+    assert all(check(ds, "a").to_pylist())
+
+
+def test_interval():
+    ds = make_dataset(pyarrow.array([(1, 2, 3)], pyarrow.month_day_nano_interval()))
+    with pytest.raises(TypeError, match=r"Cannot summarise"):
+        iudex.aggregates.Mean(upper=1)(ds, "a")
+    assert iudex.aggregates.DistinctCount(upper=1)(ds, "a").to_pylist() == [True]
+
+
+def test_bounds_required():
+    with pytest.raises(
+        ValueError,
+        match=r"At least one of lower or upper must be given.",
+    ):
+        iudex.aggregates.Mean()
+
+
+def test_bounds_ordered():
+    with pytest.raises(
+        ValueError,
+        match=r"Lower bound must not be greater than upper bound.",
+    ):
+        iudex.aggregates.NullFraction(lower=0.5, upper=0.1)
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_validate_with_row_checks(use_threads):
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.Greater(0) & iudex.aggregates.Mean(upper=60),
+            ),
+            iudex.schema.Field(
+                "b",
+                pyarrow.float64(),
+                check=iudex.aggregates.NullFraction(upper=0.1),
+            ),
+        ],
+    )
+    table = pyarrow.concat_tables(
+        pyarrow.table(
+            {"a": list(range(i * 10 + 1, i * 10 + 11)), "b": [1.0] * 10},
+            schema=schema.to_pyarrow(),
+        )
+        for i in range(10)
+    )
+    iudex.validate.validate_pyarrow(table, schema, use_threads=use_threads)
+    iudex.validate.validate_pyarrow(
+        pyarrow.dataset.dataset(table), schema, use_threads=use_threads
+    )
+
+    table = table.set_column(
+        1, "b", pyarrow.array([None] * 20 + [1.0] * 80, pyarrow.float64())
+    )
+    with pytest.raises(
+        iudex.errors.ValidationError,
+        match=r"Check failed for field 'b'.",
+    ):
+        iudex.validate.validate_pyarrow(table, schema, use_threads=use_threads)
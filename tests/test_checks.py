@@ -1,4 +1,7 @@
 import pyarrow
+import pyarrow.compute
+import pyarrow.dataset
+import pyarrow.parquet
 import pytest
 from typing import Any
 
@@ -41,6 +44,20 @@ def test_unique():
     assert check(ds, "a").to_pylist() == [False, True, False]
 
 
+def test_unique_nulls():
+    check = iudex.checks.Unique()
+
+    ds = make_dataset([1, None, 2, 2, None, 3])
+    assert check(ds, "a").to_pylist() == [True, None, False, False, None, True]
+
+
+def test_unique_column_name():
+    check = iudex.checks.Unique()
+
+    ds = pyarrow.dataset.dataset(pyarrow.table({"id": [1, 2, 1]}))
+    assert check(ds, "id").to_pylist() == [False, True, False]
+
+
 def test_greater():
     check = iudex.checks.Greater(0)
 
@@ -115,3 +132,308 @@ def test_not_in_empty():
         match=r"Value set must contain at least one value.",
     ):
         iudex.checks.NotIn(set())
+
+
+@pytest.mark.parametrize(
+    "data_type",
+    [pyarrow.string(), pyarrow.large_string(), "dictionary"],
+)
+def test_matches_regex(data_type):
+    check = iudex.checks.MatchesRegex(r"^[a-z]+-\d+$")
+
+    values = pyarrow.array(["ab-1", "ab-12", None, "AB-1", "ab1"])
+    if data_type == "dictionary":
+        values = values.dictionary_encode()
+    else:
+        values = values.cast(data_type)
+    ds = make_dataset(values)
+    assert check(ds, "a").to_pylist() == [True, True, None, False, False]
+
+
+def test_matches_regex_ignore_case():
+    check = iudex.checks.MatchesRegex(r"^ab", ignore_case=True)
+
+    ds = make_dataset(["abc", "ABC", "cab"])
+    assert check(ds, "a").to_pylist() == [True, True, False]
+
+
+def test_starts_with():
+    check = iudex.checks.StartsWith("ab")
+
+    ds = make_dataset(["abc", "cab", "AB"])
+    assert check(ds, "a").to_pylist() == [True, False, False]
+
+
+def test_ends_with():
+    check = iudex.checks.EndsWith("ab", ignore_case=True)
+
+    ds = make_dataset(["abc", "cab", "AB"])
+    assert check(ds, "a").to_pylist() == [False, True, True]
+
+
+def test_length():
+    check = iudex.checks.Length(lower=1, upper=2)
+
+    ds = make_dataset(["", "é", "éé", "ééé"])
+    assert check(ds, "a").to_pylist() == [False, True, True, False]
+
+    ds = make_dataset(pyarrow.array([b"", b"a", "é".encode()], pyarrow.binary()))
+    assert check(ds, "a").to_pylist() == [False, True, True]
+
+
+def test_length_empty():
+    with pytest.raises(
+        ValueError,
+        match=r"At least one of lower or upper must be given.",
+    ):
+        iudex.checks.Length()
+
+
+@pytest.mark.parametrize(
+    ("check", "expected"),
+    [
+        (iudex.checks.IsAscii(), [True, True, False, True, True]),
+        (iudex.checks.IsAlpha(), [True, False, True, False, False]),
+        (iudex.checks.IsAlphanumeric(), [True, True, True, False, True]),
+        (iudex.checks.IsDecimal(), [False, False, False, False, True]),
+        (iudex.checks.IsNumeric(), [False, False, False, False, True]),
+    ],
+)
+def test_character_classes(check, expected):
+    ds = make_dataset(["abc", "ab1", "é", "a b", "123"])
+    assert check(ds, "a").to_pylist() == expected
+
+
+def test_is_valid_utf8():
+    check = iudex.checks.IsValidUtf8()
+
+    ds = make_dataset([b"abc", "é".encode(), None])
+    assert check(ds, "a").to_pylist() == [True, True, None]
+
+    ds = make_dataset(pyarrow.array([b"abc", b"\xff", None], pyarrow.large_binary()))
+    assert check(ds, "a").to_pylist() == [True, False, None]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (b"", True),
+        ("\u20ac\U0001f600".encode(), True),
+        (b"\xf4\x8f\xbf\xbf", True),
+        (b"\x80", False),  # A stray continuation byte.
+        (b"\xc3", False),  # A truncated sequence.
+        (b"\xc3a", False),
+        (b"\xc0\x80", False),  # Overlong.
+        (b"\xe0\x80\x80", False),  # Overlong.
+        (b"\xed\xa0\x80", False),  # A surrogate.
+        (b"\xf4\x90\x80\x80", False),  # Above U+10FFFF.
+    ],
+)
+def test_is_valid_utf8_value(value, expected):
+    check = iudex.checks.IsValidUtf8()
+
+    # The invalid value makes the batch be checked value by value.
+    values = pyarrow.array([b"\xff", b"ok", value, None, b"\xe2\x82"])
+    assert check.evaluate(values.slice(1)).to_pylist() == [True, expected, None, False]
+
+
+def test_struct_field():
+    check = iudex.checks.StructField("x", iudex.checks.Greater(0))
+
+    values = pyarrow.StructArray.from_arrays(
+        [pyarrow.array([1, -1, -2, 3])],
+        ["x"],
+        mask=pyarrow.array([False, False, True, False]),
+    )
+    ds = make_dataset(values)
+    assert check(ds, "a").to_pylist() == [True, False, None, True]
+
+
+def test_struct_field_unique():
+    check = iudex.checks.StructField("x", iudex.checks.Unique())
+
+    values = pyarrow.StructArray.from_arrays([pyarrow.array([1, 2, 1])], ["x"])
+    ds = make_dataset(values)
+    assert check(ds, "a").to_pylist() == [False, True, False]
+    assert check(ds.to_table(), "a").to_pylist() == [False, True, False]
+
+
+@pytest.mark.parametrize(
+    "data_type",
+    [
+        pyarrow.list_(pyarrow.int64()),
+        pyarrow.large_list(pyarrow.int64()),
+        pyarrow.list_(pyarrow.int64(), 2),
+    ],
+)
+def test_list_elements(data_type):
+    check = iudex.checks.ListElements(iudex.checks.Greater(0))
+
+    values = pyarrow.array([[9, 9], [1, 2], [1, -1], None, [-1, None]], data_type)
+    # Slicing leaves an offset into the list values.
+    ds = make_dataset(values[1:])
+    assert check(ds, "a").to_pylist() == [True, False, None, False]
+
+
+def test_list_elements_empty_and_null_lists():
+    check = iudex.checks.ListElements(iudex.checks.Greater(0))
+
+    # The null list covers values which would fail the check.
+    values = pyarrow.ListArray.from_arrays(
+        pyarrow.array([0, 0, 2, 3], pyarrow.int32()),
+        pyarrow.array([-1, -1, 1]),
+        mask=pyarrow.array([False, True, False]),
+    )
+    ds = make_dataset(values)
+    assert check(ds, "a").to_pylist() == [True, None, True]
+
+
+def test_list_elements_unique():
+    check = iudex.checks.ListElements(iudex.checks.Unique())
+
+    ds = make_dataset([[1, 2], None, [3], [2, 4]])
+    assert check(ds, "a").to_pylist() == [False, None, True, False]
+
+    # Null elements pass, and results stay with the lists they belong to.
+    ds = make_dataset([[1], [None], [2], [3, None], [2]])
+    assert check(ds, "a").to_pylist() == [True, True, False, True, False]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [3, 1, None, 2, 1, None, 3, 4],
+        [0.5, -0.5, None, 0.5],
+        ["a", "b", None, "b", "c"],
+        pyarrow.array(["a", "b", "a"]).dictionary_encode(),
+        pyarrow.array([2**64 - 1, 1, 2**64 - 1], pyarrow.uint64()),
+    ],
+)
+def test_unique_partitioned(values):
+    check = iudex.checks.Unique(num_partitions=3)
+
+    ds = make_dataset(values)
+    values = ds.to_table().column("a").to_pylist()
+    expected = [None if v is None else values.count(v) == 1 for v in values]
+    assert check(ds, "a").to_pylist() == expected
+
+
+def test_unique_num_partitions_must_be_positive():
+    with pytest.raises(ValueError, match=r"num_partitions must be at least 1."):
+        iudex.checks.Unique(num_partitions=0)
+
+
+def make_partitioned_dataset(path) -> pyarrow.dataset.Dataset:
+    pyarrow.dataset.write_dataset(
+        pyarrow.table({"a": [1, 2, 1, 1, 3], "date": ["x", "x", "y", "y", "y"]}),
+        path,
+        format="parquet",
+        partitioning=["date"],
+        partitioning_flavor="hive",
+    )
+    return pyarrow.dataset.dataset(path, partitioning="hive")
+
+
+def test_per_partition(tmp_path):
+    check = iudex.checks.PerPartition(iudex.checks.Unique())
+
+    ds = make_partitioned_dataset(tmp_path)
+    results = check.partition_results(ds, "a")
+    assert {label: result.to_pylist() for label, result in results.items()} == {
+        '(date == "x")': [True, True],
+        '(date == "y")': [False, False, True],
+    }
+    assert check(ds, "a").to_pylist() == [True, True, False, False, True]
+
+    # Filtered Datasets find their partitions by scanning the partition keys.
+    filtered = ds.filter(pyarrow.compute.field("a") > 1)
+    results = check.partition_results(filtered, "a")
+    assert {label: result.to_pylist() for label, result in results.items()} == {
+        '(date == "x")': [True],
+        '(date == "y")': [True],
+    }
+
+    # A Table is a single partition.
+    assert check(ds.to_table(), "a").to_pylist() == [False, True, False, False, True]
+
+
+def test_per_partition_concurrent(tmp_path):
+    check = iudex.checks.PerPartition(iudex.checks.Unique(), max_workers=2)
+
+    ds = make_partitioned_dataset(tmp_path)
+    assert check(ds, "a").to_pylist() == [True, True, False, False, True]
+
+    with pytest.raises(ValueError, match=r"max_workers must be at least 1."):
+        iudex.checks.PerPartition(iudex.checks.Unique(), max_workers=0)
+
+
+def test_per_partition_row_order(tmp_path):
+    # The files of each partition are not next to each other.
+    paths = []
+    for i, (date, values) in enumerate([("x", [1, 1]), ("y", [5, 5]), ("x", [7, 8])]):
+        path = tmp_path / f"date={date}" / f"{i}.parquet"
+        path.parent.mkdir(exist_ok=True)
+        pyarrow.parquet.write_table(pyarrow.table({"a": values}), path)
+        paths.append(str(path))
+    ds = pyarrow.dataset.dataset(
+        paths,
+        partitioning="hive",
+        partition_base_dir=str(tmp_path),
+    )
+    check = iudex.checks.PerPartition(iudex.checks.Unique())
+
+    assert check(ds, "a").to_pylist() == [False, False, False, False, True, True]
+    any_check = iudex.checks.Any_(frozenset({check, iudex.checks.Less(2)}))
+    assert any_check(ds, "a").to_pylist() == [True, True, False, False, True, True]
+    filtered = ds.filter(pyarrow.compute.field("a") != 7)
+    assert check(filtered, "a").to_pylist() == [False, False, False, False, True]
+
+
+def test_unique_presorted():
+    check = iudex.checks.Unique(presorted=True)
+
+    table = pyarrow.table(
+        {"a": pyarrow.chunked_array([[1, 1, 2], [2, 3], [None], [3, None, 4, 5, 5]])},
+    )
+    assert check(table, "a").to_pylist() == [
+        False,
+        False,
+        False,
+        False,
+        False,
+        None,
+        False,
+        None,
+        True,
+        False,
+        False,
+    ]
+
+    ds = make_dataset([5, 4, 4, 1])
+    assert check(ds, "a").to_pylist() == [True, False, False, True]
+
+    # Values which are not sorted are counted instead.
+    ds = make_dataset([3, 1, 2, 3])
+    assert sorted(check(ds, "a").to_pylist()) == [False, False, True, True]
+
+
+def test_monotonic_increasing():
+    table = pyarrow.table(
+        {"a": pyarrow.chunked_array([[None, 1, 1], [None], [2, None, 1]])},
+    )
+
+    check = iudex.checks.MonotonicIncreasing()
+    assert check(table, "a").to_pylist() == [None, True, True, None, True, None, False]
+
+    check = iudex.checks.MonotonicIncreasing(strict=True)
+    assert check(table, "a").to_pylist() == [None, True, False, None, True, None, False]
+
+
+def test_monotonic_decreasing():
+    check = iudex.checks.MonotonicDecreasing()
+
+    ds = make_dataset(["c", "b", "b", "c"])
+    assert check(ds, "a").to_pylist() == [True, True, True, False]
+
+    check = iudex.checks.MonotonicDecreasing(strict=True)
+    assert check(ds, "a").to_pylist() == [True, True, False, False]
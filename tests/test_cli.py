@@ -0,0 +1,121 @@
+import json
+import sys
+
+import pyarrow
+import pyarrow.parquet
+import pytest
+
+import iudex.checks
+import iudex.cli
+import iudex.schema
+
+SCHEMA = iudex.schema.Schema(
+    [
+        iudex.schema.Field(
+            "a",
+            pyarrow.int64(),
+            check=iudex.checks.Greater(0),
+        ),
+    ],
+)
+
+
+def write_parquet(path, values):
+    pyarrow.parquet.write_table(
+        pyarrow.table({"a": values}, schema=SCHEMA.to_pyarrow()),
+        path,
+    )
+
+
+def read_results(capsys):
+    lines = capsys.readouterr().out.splitlines()
+    return {result["path"]: result for result in map(json.loads, lines)}
+
+
+def test_all_valid(tmp_path, capsys):
+    for i in range(5):
+        write_parquet(tmp_path / f"part-{i}.parquet", [i + 1, i + 2])
+    (tmp_path / "a.csv").write_text("a\n1\n2\n")
+    (tmp_path / "README").write_text("not data")
+
+    status = iudex.cli.main(["test_cli:SCHEMA", str(tmp_path), "--jobs", "2"])
+
+    assert status == iudex.cli.EXIT_VALID
+    results = read_results(capsys)
+    assert len(results) == 6
+    assert {result["status"] for result in results.values()} == {"valid"}
+
+
+def test_format_skips_metadata_files(tmp_path, capsys):
+    write_parquet(tmp_path / "part-0.parquet", [1, 2])
+    (tmp_path / "_SUCCESS").write_text("")
+    (tmp_path / ".part-0.parquet.crc").write_bytes(b"crc")
+    (tmp_path / "_metadata").mkdir()
+    (tmp_path / "_metadata" / "part-1").write_bytes(b"not parquet")
+
+    status = iudex.cli.main(["test_cli:SCHEMA", str(tmp_path), "-f", "parquet"])
+
+    assert status == iudex.cli.EXIT_VALID
+    assert list(read_results(capsys)) == [str(tmp_path / "part-0.parquet")]
+
+
+def test_app_dir(tmp_path, monkeypatch, capsys):
+    app_dir = tmp_path / "app"
+    app_dir.mkdir()
+    (app_dir / "cli_app_schemas.py").write_text(
+        "import pyarrow\n"
+        "import iudex.schema\n"
+        "SCHEMA = iudex.schema.Schema([iudex.schema.Field('a', pyarrow.int64())])\n",
+    )
+    write_parquet(tmp_path / "good.parquet", [1])
+    # An installed console script does not have the working directory on
+    # its path.
+    monkeypatch.setattr(
+        sys, "path", [path for path in sys.path if path not in ("", ".")]
+    )
+    monkeypatch.chdir(app_dir)
+
+    status = iudex.cli.main(["cli_app_schemas:SCHEMA", str(tmp_path / "good.parquet")])
+
+    assert status == iudex.cli.EXIT_VALID
+
+
+def test_invalid(tmp_path, capsys):
+    write_parquet(tmp_path / "good.parquet", [1, 2])
+    write_parquet(tmp_path / "bad.parquet", [0, 1])
+
+    status = iudex.cli.main(["test_cli:SCHEMA", str(tmp_path / "*.parquet")])
+
+    assert status == iudex.cli.EXIT_INVALID
+    results = read_results(capsys)
+    assert results[str(tmp_path / "good.parquet")]["status"] == "valid"
+    assert results[str(tmp_path / "bad.parquet")]["status"] == "invalid"
+
+
+def test_unreadable(tmp_path, capsys):
+    write_parquet(tmp_path / "bad.parquet", [0, 1])
+    (tmp_path / "broken.parquet").write_bytes(b"not parquet")
+
+    status = iudex.cli.main(["test_cli:SCHEMA", str(tmp_path)])
+
+    assert status == iudex.cli.EXIT_UNREADABLE
+    results = read_results(capsys)
+    assert results[str(tmp_path / "broken.parquet")]["status"] == "error"
+
+
+@pytest.mark.parametrize(
+    "reference",
+    ["test_cli", "test_cli:missing", "test_cli:write_parquet", "missing:SCHEMA"],
+)
+def test_bad_schema(tmp_path, reference):
+    write_parquet(tmp_path / "good.parquet", [1])
+
+    with pytest.raises(SystemExit) as e:
+        iudex.cli.main([reference, str(tmp_path)])
+    assert e.value.code == iudex.cli.EXIT_USAGE
+
+
+def test_no_files(tmp_path):
+    with pytest.raises(SystemExit) as e:
+        iudex.cli.main(["test_cli:SCHEMA", str(tmp_path)])
+    assert e.value.code == iudex.cli.EXIT_USAGE
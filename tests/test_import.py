@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+# The time `import iudex.schema` may take on top of `import pyarrow`.
+IMPORT_TIME_BUDGET_US = 100_000
+
+HEAVY_MODULES = [
+    "pyarrow.acero",
+    "pyarrow.compute",
+    "pyarrow.dataset",
+    "pyarrow.interchange",
+]
+
+
+def run_python(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+def cumulative_import_time_us(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} was not imported.")
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "iudex",
+        "iudex.checks",
+        "iudex.cli",
+        "iudex.scan",
+        "iudex.schema",
+        "iudex.validate",
+    ],
+)
+def test_heavy_modules_not_imported(module):
+    result = run_python(
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+    )
+    assert result.stdout.split() == []
+
+
+def test_validate_table_does_not_import_dataset():
+    result = run_python(
+        "import sys, pyarrow, iudex.checks, iudex.schema, iudex.validate\n"
+        "schema = iudex.schema.Schema(\n"
+        "    [iudex.schema.Field('a', pyarrow.int64(), check=iudex.checks.Greater(0))]\n"
+        ")\n"
+        "table = pyarrow.table({'a': [1, 2, 3]}, schema=schema.to_pyarrow())\n"
+        "iudex.validate.validate_pyarrow(table, schema)\n"
+        "print('pyarrow.dataset' in sys.modules, 'pyarrow.acero' in sys.modules)\n",
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_import_time_budget():
+    result = run_python("import pyarrow; import iudex.schema")
+    cumulative = cumulative_import_time_us(result.stderr, "iudex.schema")
+    assert cumulative < IMPORT_TIME_BUDGET_US
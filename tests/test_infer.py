@@ -0,0 +1,151 @@
+import datetime
+
+import pyarrow
+import pyarrow.dataset
+
+import iudex.checks
+import iudex.infer
+import iudex.validate
+
+
+def make_table():
+    num_rows = 1000
+    return pyarrow.Table.from_batches(
+        pyarrow.table(
+            {
+                "id": range(num_rows),
+                "category": ["a", "b", None, "c"] * (num_rows // 4),
+                "value": [i % 7 / 2 for i in range(num_rows)],
+                "time": [
+                    datetime.datetime(2024, 1, 1) + datetime.timedelta(hours=i)
+                    for i in range(num_rows)
+                ],
+                "day": pyarrow.array(
+                    [datetime.date(2024, 1, 1 + i % 3) for i in range(num_rows)],
+                    pyarrow.date32(),
+                ),
+                "clock": pyarrow.array(
+                    [datetime.time(i // 60 % 24, i % 60) for i in range(num_rows)],
+                    pyarrow.time32("s"),
+                ),
+                "tags": [["x"]] * num_rows,
+            },
+        ).to_batches(max_chunksize=100),
+    )
+
+
+def test_infer_schema():
+    table = make_table()
+
+    schema = iudex.infer.infer_schema(table, verify_unique=True)
+
+    assert schema.to_pyarrow() == table.schema
+    checks = {field.name: field.check for field in schema.fields}
+    assert checks["id"] == iudex.checks.All(
+        {
+            iudex.checks.GreaterEqual(0),
+            iudex.checks.LessEqual(999),
+            iudex.checks.Unique(),
+        },
+    )
+    assert checks["category"] == iudex.checks.IsIn({"a", "b", "c", None})
+    # Floating point values are not collected into a value set.
+    assert checks["value"] == iudex.checks.All(
+        {iudex.checks.GreaterEqual(0.0), iudex.checks.LessEqual(3.0)},
+    )
+    assert checks["time"] == iudex.checks.All(
+        {
+            iudex.checks.GreaterEqual(datetime.datetime(2024, 1, 1)),
+            iudex.checks.LessEqual(datetime.datetime(2024, 2, 11, 15)),
+            iudex.checks.Unique(),
+        },
+    )
+    assert checks["day"] == iudex.checks.IsIn(
+        {datetime.date(2024, 1, day) for day in (1, 2, 3)},
+    )
+    assert checks["clock"] == iudex.checks.All(
+        {
+            iudex.checks.GreaterEqual(datetime.time(0, 0)),
+            iudex.checks.LessEqual(datetime.time(16, 39)),
+            iudex.checks.Unique(),
+        },
+    )
+    assert checks["tags"] is None
+    # The data passes the checks proposed for it.
+    iudex.validate.validate_pyarrow(table, schema)
+
+
+def test_profile_max_rows():
+    dataset = pyarrow.dataset.dataset(make_table())
+
+    profiles = iudex.infer.profile(dataset, use_threads=False, max_rows=250)
+
+    assert set(profiles) == {"id", "category", "value", "time", "day", "clock"}
+    assert profiles["id"].nulls.count == 300
+    assert profiles["id"].range.max == 299
+    assert profiles["category"].nulls.null_count == 75
+
+
+def test_infer_schema_passes_own_data():
+    num_rows = 1000
+    table = pyarrow.table(
+        {
+            # A few repeated values are within the distinct count's error.
+            "repeated": [i % 970 for i in range(num_rows)],
+            "nan": [float("nan") if i % 50 == 0 else i / 3 for i in range(num_rows)],
+            "nanoseconds": pyarrow.array(range(num_rows), pyarrow.timestamp("ns")),
+            "duration": pyarrow.array(range(num_rows), pyarrow.duration("s")),
+            "unsigned": pyarrow.array(
+                [2**63 + i for i in range(num_rows)],
+                pyarrow.uint64(),
+            ),
+        },
+    )
+
+    schema = iudex.infer.infer_schema(table, verify_unique=True)
+
+    checks = {field.name: field.check for field in schema.fields}
+    assert checks["repeated"] == iudex.checks.All(
+        {iudex.checks.GreaterEqual(0), iudex.checks.LessEqual(969)},
+    )
+    assert checks["nan"] is None
+    assert checks["nanoseconds"] == iudex.checks.Unique()
+    assert checks["duration"] == iudex.checks.Unique()
+    assert checks["unsigned"] == iudex.checks.All(
+        {
+            iudex.checks.GreaterEqual(2**63),
+            iudex.checks.LessEqual(2**63 + 999),
+            iudex.checks.Unique(),
+        },
+    )
+    iudex.validate.validate_pyarrow(table, schema)
+
+
+def test_infer_schema_verify_unique():
+    table = make_table()
+
+    # Uniqueness is only estimated unless it is verified.
+    schema = iudex.infer.infer_schema(table)
+    checks = {field.name: field.check for field in schema.fields}
+    assert checks["id"] == iudex.checks.All(
+        {iudex.checks.GreaterEqual(0), iudex.checks.LessEqual(999)},
+    )
+
+    # Only the rows which were profiled are verified.
+    table = pyarrow.Table.from_batches(
+        pyarrow.table({"id": list(range(500)) * 2}).to_batches(max_chunksize=100),
+    )
+    schema = iudex.infer.infer_schema(
+        table,
+        use_threads=False,
+        max_rows=400,
+        max_values=0,
+        verify_unique=True,
+    )
+    assert schema.fields[0].check == iudex.checks.All(
+        {
+            iudex.checks.GreaterEqual(0),
+            iudex.checks.LessEqual(399),
+            iudex.checks.Unique(),
+        },
+    )
@@ -0,0 +1,175 @@
+import datetime
+import math
+
+import numpy
+import pyarrow
+import pytest
+
+import iudex.sketches
+
+
+def batches(values, size=1000):
+    for start in range(0, len(values), size):
+        yield pyarrow.array(values[start : start + size])
+
+
+def test_null_counter():
+    counter = iudex.sketches.NullCounter()
+    assert counter.null_fraction is None
+
+    counter.update(pyarrow.array([1, None, 3, None]))
+    other = iudex.sketches.NullCounter()
+    other.update(pyarrow.array([None, 2, 3, 4]))
+    counter.merge(other)
+
+    assert counter.count == 8
+    assert counter.null_count == 3
+    assert counter.null_fraction == 3 / 8
+
+
+def test_moments():
+    rng = numpy.random.default_rng(0)
+    values = rng.normal(1e6, 3.0, 10_000)
+
+    moments = iudex.sketches.Moments()
+    other = iudex.sketches.Moments()
+    for i, batch in enumerate(batches(values)):
+        (moments if i % 2 else other).update(batch)
+    moments.update(pyarrow.array([None], pyarrow.float64()))
+    moments.merge(other)
+
+    assert moments.count == len(values)
+    assert moments.mean == pytest.approx(values.mean())
+    assert moments.variance == pytest.approx(values.var())
+    assert moments.standard_deviation == pytest.approx(values.std())
+
+
+def test_moments_empty():
+    moments = iudex.sketches.Moments()
+    moments.update(pyarrow.array([None, None], pyarrow.int64()))
+    assert moments.mean is None
+    assert moments.variance is None
+    assert moments.standard_deviation is None
+
+
+def test_quantiles():
+    rng = numpy.random.default_rng(0)
+    values = rng.permutation(100_000).astype(float)
+
+    sketch = iudex.sketches.Quantiles(seed=0)
+    other = iudex.sketches.Quantiles(seed=1)
+    for i, batch in enumerate(batches(values)):
+        (sketch if i % 2 else other).update(batch)
+    sketch.merge(other)
+
+    assert sketch.count == len(values)
+    for q in [0.01, 0.25, 0.5, 0.99]:
+        assert sketch.quantile(q) == pytest.approx(q * len(values), abs=2_000)
+    # Memory is bounded by the sketch size, not the number of values.
+    assert sum(len(level) for level in sketch._levels) < 4 * sketch.k
+
+
+def test_quantiles_ignores_nulls_and_nan():
+    sketch = iudex.sketches.Quantiles()
+    assert sketch.quantile(0.5) is None
+
+    sketch.update(pyarrow.array([1.0, None, math.nan, 3.0, 2.0]))
+    assert sketch.count == 3
+    assert sketch.quantile(0) == 1.0
+    assert sketch.quantile(0.5) == 2.0
+    assert sketch.quantile(1) == 3.0
+
+    with pytest.raises(ValueError, match=r"Quantile must be between 0 and 1."):
+        sketch.quantile(1.5)
+
+
+@pytest.mark.parametrize(
+    "make_values",
+    [
+        lambda n: list(range(n)),
+        lambda n: [float(i) for i in range(n)],
+        lambda n: [f"value-{i}" for i in range(n)],
+        lambda n: [f"value-{i}".encode() for i in range(n)],
+        lambda n: [datetime.date(2000, 1, 1) + datetime.timedelta(i) for i in range(n)],
+    ],
+)
+def test_distinct_counter(make_values):
+    values = make_values(20_000)
+
+    counter = iudex.sketches.DistinctCounter()
+    other = iudex.sketches.DistinctCounter()
+    # Every value is seen twice, by different sketches.
+    for batch in batches(values):
+        counter.update(batch)
+        other.update(batch)
+    counter.merge(other)
+
+    assert counter.distinct_count == pytest.approx(len(values), rel=0.03)
+
+
+def test_distinct_counter_small():
+    counter = iudex.sketches.DistinctCounter()
+    assert counter.distinct_count == 0
+
+    counter.update(pyarrow.array([1, 2, 2, 3, None]).dictionary_encode())
+    assert counter.distinct_count == 3
+
+
+@pytest.mark.parametrize(
+    "data_type",
+    [pyarrow.string(), pyarrow.large_string(), pyarrow.binary()],
+)
+def test_hash_bytes(data_type):
+    values = pyarrow.array(["", "ab", "ba", None, "abc", "ab"], data_type)
+
+    hashes = iudex.sketches._hash(values)
+
+    assert len(hashes) == 5
+    assert hashes[1] == hashes[4]
+    assert len(set(hashes.tolist())) == 4
+    # Hashes do not depend on the type, the batch or the position in it.
+    expected = iudex.sketches._hash(pyarrow.array(["", "ab", "ba", "abc", "ab"]))
+    assert hashes.tolist() == expected.tolist()
+    assert iudex.sketches._hash(values.slice(4)).tolist() == expected[3:].tolist()
+
+
+def test_hash_uint64():
+    values = pyarrow.array([2**64 - 1, 2**63, 1, 2**64 - 1], pyarrow.uint64())
+
+    hashes = iudex.sketches._hash(values)
+
+    assert len(set(hashes.tolist())) == 3
+    assert hashes[0] == hashes[3]
+    # Integers which fit in both types hash alike.
+    assert hashes[2] == iudex.sketches._hash(pyarrow.array([1]))[0]
+    assert (iudex.sketches._hash_each(values) == hashes).all()
+
+    counter = iudex.sketches.DistinctCounter()
+    counter.update(values)
+    assert counter.distinct_count == 3
+
+
+def test_min_max():
+    min_max = iudex.sketches.MinMax()
+    min_max.update(pyarrow.array([None], pyarrow.float64()))
+    assert (min_max.min, min_max.max) == (None, None)
+
+    min_max.update(pyarrow.array([1.5, None, float("nan"), -2.0]))
+    other = iudex.sketches.MinMax()
+    other.update(pyarrow.array([3.0, 0.0]))
+    min_max.merge(other)
+
+    assert (min_max.min, min_max.max) == (-2.0, 3.0)
+
+
+def test_value_set():
+    value_set = iudex.sketches.ValueSet(max_size=3)
+    value_set.update(pyarrow.array(["a", "b", None, "a"]).dictionary_encode())
+    other = iudex.sketches.ValueSet(max_size=3)
+    other.update(pyarrow.array(["c"]))
+    value_set.merge(other)
+    assert value_set.values == {"a", "b", "c"}
+
+    other.update(pyarrow.array(["d"]))
+    value_set.merge(other)
+    assert value_set.values is None
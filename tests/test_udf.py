@@ -0,0 +1,77 @@
+import pyarrow
+import pyarrow.compute
+import pyarrow.dataset
+import pytest
+
+import iudex.checks
+import iudex.errors
+import iudex.schema
+import iudex.udf
+import iudex.validate
+
+
+@iudex.udf.register_check("test_udf_is_even", pyarrow.int64())
+def is_even(values):
+    return pyarrow.compute.equal(pyarrow.compute.bit_wise_and(values, 1), 0)
+
+
+@iudex.udf.register_check("test_udf_is_short", pyarrow.string(), numpy=True)
+def is_short(values):
+    return [value is None or len(value) < 3 for value in values]
+
+
+def make_dataset(data):
+    return pyarrow.dataset.dataset(
+        pyarrow.table({"a": data}),
+    )
+
+
+def test_call():
+    ds = make_dataset([2, 3, None, 4])
+    assert is_even(ds, "a").to_pylist() == [True, False, None, True]
+    assert is_even(ds.to_table(), "a").to_pylist() == [True, False, None, True]
+
+
+def test_numpy():
+    ds = make_dataset(["a", "abc", None])
+    assert is_short(ds, "a").to_pylist() == [True, False, None]
+
+
+def test_casts_input():
+    ds = make_dataset(pyarrow.array([1, 2], pyarrow.int32()))
+    assert is_even(ds, "a").to_pylist() == [False, True]
+
+    values = pyarrow.array(["a", "abc", "a"]).dictionary_encode()
+    assert is_short.evaluate(values).to_pylist() == [True, False, True]
+
+
+def test_expression():
+    ds = make_dataset([1, 2, 3, 4])
+    table = ds.to_table(filter=is_even.expression("a"))
+    assert table.column("a").to_pylist() == [2, 4]
+
+
+def test_validate():
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=is_even & iudex.checks.Greater(0),
+            ),
+        ],
+    )
+    table = pyarrow.table({"a": [2, 4, 6]}, schema=schema.to_pyarrow())
+    iudex.validate.validate_pyarrow(table, schema)
+
+    table = pyarrow.table({"a": [2, 3, 6]}, schema=schema.to_pyarrow())
+    with pytest.raises(iudex.errors.ValidationError):
+        iudex.validate.validate_pyarrow(table, schema)
+
+
+def test_duplicate_name():
+    with pytest.raises(
+        ValueError,
+        match=r"A function named 'test_udf_is_even' is already registered.",
+    ):
+        iudex.udf.register_check("test_udf_is_even", pyarrow.int64())(lambda v: v)
@@ -1,7 +1,17 @@
+import dataclasses
+import subprocess
+import sys
+import threading
+
 import pandas as pd
 import pyarrow
+import pyarrow.compute
+import pyarrow.dataset
+import pyarrow.feather
+import pyarrow.parquet
 import pytest
 
+import iudex.aggregates
 import iudex.checks
 import iudex.schema
 import iudex.validate
@@ -100,3 +110,733 @@ def test_validate_dataframe():
         },
     )
     iudex.validate.validate_dataframe(dataframe, schema)
+
+
+@pytest.mark.filterwarnings("ignore:The Dataframe Interchange Protocol is deprecated")
+def test_validate_dataframe_allow_copy():
+    schema = iudex.schema.Schema([iudex.schema.Field("a", pyarrow.int64())])
+    # pandas copies nullable integers to export them as Arrow.
+    dataframe = pd.DataFrame({"a": [1, 2, 3]}).astype({"a": pd.Int64Dtype()})
+    iudex.validate.validate_dataframe(dataframe, schema)
+    with pytest.raises(RuntimeError, match=r"allow_copy=False"):
+        iudex.validate.validate_dataframe(dataframe, schema, allow_copy=False)
+
+
+class _StreamExporter:
+    def __init__(self, table: pyarrow.Table) -> None:
+        self._table = table
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        return self._table.__arrow_c_stream__(requested_schema)
+
+
+class _ArrayExporter:
+    def __init__(self, batch: pyarrow.RecordBatch) -> None:
+        self._batch = batch
+
+    def __arrow_c_array__(self, requested_schema=None):
+        return self._batch.__arrow_c_array__(requested_schema)
+
+
+def test_validate_dataframe_arrow_c_stream():
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.Greater(0),
+            ),
+        ],
+    )
+    table = pyarrow.concat_tables(
+        [
+            pyarrow.table({"a": [1, 2]}, schema=schema.to_pyarrow()),
+            pyarrow.table({"a": [3]}, schema=schema.to_pyarrow()),
+        ]
+    )
+    iudex.validate.validate_dataframe(_StreamExporter(table), schema)
+    imported = iudex.validate._to_pyarrow(_StreamExporter(table), allow_copy=False)
+    assert imported.column("a").num_chunks == 2
+    assert imported == table
+
+    table = pyarrow.table({"a": [-1, -2]}, schema=schema.to_pyarrow())
+    with pytest.raises(iudex.errors.ValidationError):
+        iudex.validate.validate_dataframe(_StreamExporter(table), schema)
+
+
+def test_validate_dataframe_arrow_c_array():
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.Greater(0),
+            ),
+        ],
+    )
+    batch = pyarrow.record_batch({"a": [1, 2, 3]}, schema=schema.to_pyarrow())
+    iudex.validate.validate_dataframe(_ArrayExporter(batch), schema)
+
+    batch = pyarrow.record_batch({"a": [1, 2]}, schema=pyarrow.schema({"a": "int32"}))
+    with pytest.raises(iudex.errors.SchemaError):
+        iudex.validate.validate_dataframe(_ArrayExporter(batch), schema)
+
+
+def _file_schema() -> iudex.schema.Schema:
+    return iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.Greater(0) & iudex.checks.Unique(),
+            ),
+            iudex.schema.Field("b", pyarrow.string()),
+        ],
+    )
+
+
+def test_validate_file_ipc(tmp_path):
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field("a", pyarrow.int64(), check=iudex.checks.Greater(0)),
+            iudex.schema.Field("b", pyarrow.string(), check=iudex.checks.IsIn({"x"})),
+        ],
+    )
+    table = pyarrow.table(
+        {"a": range(1, 100_001), "b": ["x"] * 100_000},
+        schema=schema.to_pyarrow(),
+    )
+    path = tmp_path / "data.arrow"
+    pyarrow.feather.write_feather(table, path, compression="uncompressed")
+    pool = pyarrow.proxy_memory_pool(pyarrow.default_memory_pool())
+
+    dataset = iudex.validate.validate_file(path, schema, memory_pool=pool)
+
+    # The file is memory-mapped, so validation does not copy it onto the
+    # heap. It only allocates the checks' boolean results, one bit per value.
+    assert 0 < pool.max_memory() < table.nbytes / 10
+    assert dataset.to_table() == table
+
+
+def test_validate_file_parquet(tmp_path):
+    schema = _file_schema()
+    paths = []
+    for i, values in enumerate([[1, 2], [2, 3]]):
+        path = tmp_path / f"part-{i}.parquet"
+        pyarrow.parquet.write_table(
+            pyarrow.table(
+                {"a": values, "b": ["x", "y"]},
+                schema=schema.to_pyarrow(),
+            ),
+            path,
+        )
+        paths.append(path)
+
+    iudex.validate.validate_file(paths[:1], schema)
+    with pytest.raises(iudex.errors.ValidationError):
+        iudex.validate.validate_file(paths, schema)
+
+
+def test_validate_file_csv(tmp_path):
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field("a", pyarrow.int64(), nullable=False),
+            iudex.schema.Field("b", pyarrow.string()),
+        ],
+    )
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,y\n")
+    dataset = iudex.validate.validate_file(path, schema)
+    assert dataset.to_table().column("a").to_pylist() == [1, 2]
+
+    path.write_text("a,b,c\n1,x,3\n")
+    with pytest.raises(iudex.errors.SchemaError, match=r"do not match"):
+        iudex.validate.validate_file(path, schema)
+
+    path.write_text("a\n1\n")
+    with pytest.raises(iudex.errors.SchemaError, match=r"do not match"):
+        iudex.validate.validate_file(path, schema)
+
+    path.write_text("a,b\n1,x\n,y\n")
+    with pytest.raises(iudex.errors.ValidationError, match=r"'a'"):
+        iudex.validate.validate_file(path, schema)
+
+
+def test_validate_file_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match=r"Cannot infer the file format"):
+        iudex.validate.validate_file(tmp_path / "data.txt", _file_schema())
+
+
+@dataclasses.dataclass(frozen=True)
+class CountingGreater(iudex.checks.ElementwiseCheck):
+    value: int
+    calls: list[int] = dataclasses.field(
+        default_factory=list, compare=False, hash=False, repr=False
+    )
+
+    def evaluate(self, values):
+        self.calls.append(len(values))
+        return pyarrow.compute.greater(values, self.value)
+
+
+def test_validate_many():
+    check = CountingGreater(0)
+    base = [
+        iudex.schema.Field("a", pyarrow.int64(), check=check),
+        iudex.schema.Field("b", pyarrow.string()),
+    ]
+    schemas = [
+        iudex.schema.Schema(base),
+        iudex.schema.Schema(
+            [
+                iudex.schema.Field(
+                    "a",
+                    pyarrow.int64(),
+                    check=CountingGreater(0) & iudex.checks.Less(3),
+                ),
+                iudex.schema.Field(
+                    "b",
+                    pyarrow.string(),
+                    check=iudex.checks.IsIn({"x", "y"}),
+                ),
+            ],
+        ),
+        iudex.schema.Schema([base[0]]),
+    ]
+    table = pyarrow.table(
+        {"a": [1, 2, 3], "b": ["x", "y", "z"]},
+        schema=schemas[0].to_pyarrow(),
+    )
+
+    results = iudex.validate.validate_many(table, schemas)
+
+    assert [result.schema for result in results] == schemas
+    assert results[0].passed
+    assert results[1].failed_fields == ("a", "b")
+    assert not results[1].passed
+    assert results[2].schema_error is not None
+    with pytest.raises(iudex.errors.SchemaError):
+        results[2].raise_for_failure()
+    with pytest.raises(
+        iudex.errors.ValidationError,
+        match=r"Check failed for field 'a'.",
+    ):
+        results[1].raise_for_failure()
+    # The check shared by both matching schemas was evaluated only once.
+    assert check.calls == [3]
+
+
+def test_equal_checks_hash_equally():
+    assert hash(iudex.checks.IsIn({1, 2})) == hash(iudex.checks.IsIn([2, 1]))
+    assert iudex.checks.Greater(0) & iudex.checks.Less(1) == iudex.checks.All(
+        {iudex.checks.Less(1), iudex.checks.Greater(0)}
+    )
+
+
+def test_validate_nested():
+    point = pyarrow.struct(
+        [
+            pyarrow.field("x", pyarrow.float64()),
+            pyarrow.field("tags", pyarrow.list_(pyarrow.string())),
+        ]
+    )
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "point",
+                point,
+                children=[
+                    iudex.schema.Field(
+                        "x",
+                        pyarrow.float64(),
+                        check=iudex.checks.GreaterEqual(0),
+                    ),
+                    iudex.schema.Field(
+                        "tags",
+                        pyarrow.list_(pyarrow.string()),
+                        children=[
+                            iudex.schema.Field(
+                                "item",
+                                pyarrow.string(),
+                                check=iudex.checks.IsIn({"a", "b"}),
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    )
+    table = pyarrow.table(
+        {
+            "point": [
+                {"x": 1.0, "tags": ["a", "b"]},
+                None,
+                {"x": 0.0, "tags": []},
+            ]
+        },
+        schema=schema.to_pyarrow(),
+    )
+    iudex.validate.validate_pyarrow(table, schema)
+
+    table = pyarrow.table(
+        {"point": [{"x": 1.0, "tags": ["a", "c"]}]},
+        schema=schema.to_pyarrow(),
+    )
+    with pytest.raises(
+        iudex.errors.ValidationError,
+        match=r"Check failed for field 'point'.",
+    ):
+        iudex.validate.validate_pyarrow(table, schema)
+
+
+def test_field_children_must_match():
+    with pytest.raises(ValueError, match=r"Child 'y' does not match"):
+        iudex.schema.Field(
+            "point",
+            pyarrow.struct([pyarrow.field("x", pyarrow.float64())]),
+            children=[iudex.schema.Field("y", pyarrow.float64())],
+        )
+    with pytest.raises(ValueError, match=r"A list field must have a single child."):
+        iudex.schema.Field(
+            "tags",
+            pyarrow.list_(pyarrow.string()),
+            children=[
+                iudex.schema.Field("item", pyarrow.string()),
+                iudex.schema.Field("item", pyarrow.string()),
+            ],
+        )
+    with pytest.raises(
+        ValueError,
+        match=r"Only struct and list fields can have children.",
+    ):
+        iudex.schema.Field(
+            "x",
+            pyarrow.float64(),
+            children=[iudex.schema.Field("item", pyarrow.string())],
+        )
+
+
+def test_validate_many_reports_peak_memory(tmp_path):
+    schema = iudex.schema.Schema(
+        [iudex.schema.Field("a", pyarrow.int64(), check=iudex.checks.Greater(0))],
+    )
+    pyarrow.parquet.write_table(
+        pyarrow.table({"a": range(1, 10_001)}, schema=schema.to_pyarrow()),
+        tmp_path / "data.parquet",
+    )
+    dataset = pyarrow.dataset.dataset(tmp_path / "data.parquet")
+    pool = pyarrow.system_memory_pool()
+
+    (result,) = iudex.validate.validate_many(dataset, [schema], memory_pool=pool)
+
+    assert result.passed
+    assert result.peak_memory > 0
+
+
+def test_validate_many_peak_memory_includes_unique():
+    # Run in a new process, so that the default memory pool has not already
+    # reached a higher peak.
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import pyarrow, iudex.checks, iudex.schema, iudex.validate\n"
+            "schema = iudex.schema.Schema(\n"
+            "    [iudex.schema.Field('a', pyarrow.int64(), check=iudex.checks.Unique())]\n"
+            ")\n"
+            "table = pyarrow.table({'a': range(200_000)}, schema=schema.to_pyarrow())\n"
+            "(result,) = iudex.validate.validate_many(table, [schema])\n"
+            "print(result.peak_memory, table.nbytes)\n",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    peak_memory, nbytes = map(int, result.stdout.split())
+    # The peak includes Unique's hash table, which is freed before the
+    # check returns.
+    assert peak_memory > nbytes
+
+
+def test_checks_allocate_from_memory_pool():
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.Greater(0) & iudex.aggregates.Mean(upper=10**6),
+            ),
+            iudex.schema.Field(
+                "b",
+                pyarrow.string(),
+                check=iudex.checks.StartsWith("x"),
+            ),
+        ],
+    )
+    table = pyarrow.table(
+        {"a": range(1, 10_001), "b": ["x"] * 10_000},
+        schema=schema.to_pyarrow(),
+    )
+    pool = pyarrow.proxy_memory_pool(pyarrow.default_memory_pool())
+
+    (result,) = iudex.validate.validate_many(table, [schema], memory_pool=pool)
+
+    assert result.passed
+    assert pool.max_memory() > 0
+    assert pool.bytes_allocated() == 0
+
+
+def peak_memory_in_new_process(memory_pool: str) -> int:
+    # A new process's default memory pool has not already reached a higher
+    # peak.
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import pyarrow, iudex.checks, iudex.schema, iudex.validate\n"
+            "schema = iudex.schema.Schema(\n"
+            "    [iudex.schema.Field('a', pyarrow.int64(), check=iudex.checks.Unique())]\n"
+            ")\n"
+            "table = pyarrow.table({'a': range(200_000)}, schema=schema.to_pyarrow())\n"
+            "(result,) = iudex.validate.validate_many(\n"
+            f"    table, [schema], memory_pool={memory_pool}\n"
+            ")\n"
+            "print(result.peak_memory)\n",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return int(result.stdout)
+
+
+def test_validate_many_peak_memory_default_pool():
+    # Memory allocated through the default pool is not counted twice.
+    peak_memory = peak_memory_in_new_process("pyarrow.default_memory_pool()")
+    assert peak_memory < 1.5 * peak_memory_in_new_process("None")
+
+
+def test_validate_many_peak_memory_shared_pool():
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.MonotonicIncreasing(),
+            ),
+        ],
+    )
+    table = pyarrow.table({"a": range(100_000)}, schema=schema.to_pyarrow())
+    pool = pyarrow.system_memory_pool()
+
+    peaks = [
+        iudex.validate.validate_many(table, [schema], memory_pool=pool)[0].peak_memory
+        for _ in range(3)
+    ]
+
+    # The check's memory is freed before the peak is sampled, and the pool's
+    # peak from earlier calls does not hide it.
+    assert min(peaks) > table.nbytes / 10
+    assert peaks[1] == peaks[2]
+
+
+def test_memory_limit_exceeded(tmp_path):
+    schema = iudex.schema.Schema(
+        [iudex.schema.Field("a", pyarrow.int64(), check=iudex.checks.Greater(0))],
+    )
+    pyarrow.parquet.write_table(
+        pyarrow.table({"a": range(1, 10_001)}, schema=schema.to_pyarrow()),
+        tmp_path / "data.parquet",
+    )
+    dataset = pyarrow.dataset.dataset(tmp_path / "data.parquet")
+    pool = pyarrow.system_memory_pool()
+
+    with pytest.raises(iudex.errors.MemoryLimitError):
+        iudex.validate.validate_pyarrow(
+            dataset,
+            schema,
+            memory_pool=pool,
+            memory_limit=1,
+        )
+
+    with pytest.raises(ValueError, match=r"memory_limit must be positive."):
+        iudex.validate.validate_pyarrow(dataset, schema, memory_limit=0)
+
+
+def test_memory_limit_partitions_unique(monkeypatch):
+    schema = iudex.schema.Schema(
+        [iudex.schema.Field("a", pyarrow.int64(), check=iudex.checks.Unique())],
+    )
+    table = pyarrow.table({"a": [1, 2, 3, 2]}, schema=schema.to_pyarrow())
+    num_partitions = []
+    unique_partitioned = iudex.checks._unique_partitioned
+
+    def spy(data, column, n):
+        num_partitions.append(n)
+        return unique_partitioned(data, column, n)
+
+    monkeypatch.setattr(iudex.checks, "_unique_partitioned", spy)
+    # Pretend that Unique needs far more memory than it has.
+    monkeypatch.setattr(iudex.validate, "_unique_memory", lambda *_: 10**12)
+
+    (result,) = iudex.validate.validate_many(table, [schema], memory_limit=10**9)
+
+    assert result.failed_fields == ("a",)
+    assert num_partitions == [iudex.validate._MAX_UNIQUE_PARTITIONS]
+
+
+def chunked_table(schema, num_chunks, chunk_size):
+    values = range(1, num_chunks * chunk_size + 1)
+    table = pyarrow.table(
+        {field.name: values for field in schema.fields},
+        schema=schema.to_pyarrow(),
+    )
+    return pyarrow.Table.from_batches(table.to_batches(max_chunksize=chunk_size))
+
+
+def test_validate_many_max_rows():
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field("a", pyarrow.int64(), check=iudex.checks.Less(95)),
+            iudex.schema.Field("b", pyarrow.int64(), check=iudex.checks.Less(5)),
+        ],
+    )
+    table = chunked_table(schema, num_chunks=10, chunk_size=10)
+
+    (result,) = iudex.validate.validate_many(
+        table,
+        [schema],
+        use_threads=False,
+        max_rows=25,
+    )
+
+    assert result.stopped == "max_rows"
+    assert result.progress.rows == 30
+    # The failures in the first rows are found, but not those after them.
+    assert result.failed_fields == ("b",)
+    assert result.unchecked_fields == ("a",)
+    assert not result.complete
+    assert not result.passed
+
+
+@pytest.mark.parametrize("limit", ["max_rows", "max_bytes"])
+def test_validate_many_limit_reached_at_end(limit):
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.Greater(0) & iudex.checks.Unique(),
+            ),
+        ],
+    )
+    table = chunked_table(schema, num_chunks=10, chunk_size=10)
+    # Exactly what the pass over the data reads.
+    limits = {"max_rows": table.num_rows, "max_bytes": table.nbytes}
+
+    (result,) = iudex.validate.validate_many(
+        table,
+        [schema],
+        use_threads=False,
+        **{limit: limits[limit]},
+    )
+
+    assert result.stopped is None
+    assert result.progress.checks == 1
+    assert result.passed
+
+
+def test_validate_many_cancel():
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.Greater(0) & iudex.checks.Unique(),
+            ),
+        ],
+    )
+    table = chunked_table(schema, num_chunks=10, chunk_size=10)
+    cancel = threading.Event()
+    reports = []
+
+    def progress(report):
+        reports.append(report)
+        # Cancel from another thread once the first batch is done.
+        thread = threading.Thread(target=cancel.set)
+        thread.start()
+        thread.join()
+
+    (result,) = iudex.validate.validate_many(
+        table,
+        [schema],
+        use_threads=False,
+        cancel=cancel,
+        progress=progress,
+    )
+
+    assert result.stopped == "cancelled"
+    assert result.unchecked_fields == ("a",)
+    assert [report.batches for report in reports] == [1]
+    assert reports[0].total_checks == 1
+    assert reports[0].checks == 0
+
+
+def test_validate_many_timeout():
+    schema = iudex.schema.Schema(
+        [iudex.schema.Field("a", pyarrow.int64(), check=iudex.checks.Unique())],
+    )
+    table = chunked_table(schema, num_chunks=1, chunk_size=10)
+
+    (result,) = iudex.validate.validate_many(table, [schema], timeout=0)
+
+    assert result.stopped == "timeout"
+    assert result.unchecked_fields == ("a",)
+    assert result.progress.checks == 0
+
+
+def test_validate_many_progress(tmp_path):
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.Greater(0) & iudex.checks.Unique(),
+            ),
+        ],
+    )
+    for i in range(3):
+        pyarrow.parquet.write_table(
+            pyarrow.table({"a": [2 * i + 1, 2 * i + 2]}, schema=schema.to_pyarrow()),
+            tmp_path / f"part-{i}.parquet",
+        )
+    dataset = pyarrow.dataset.dataset(tmp_path)
+    reports = []
+
+    (result,) = iudex.validate.validate_many(
+        dataset,
+        [schema],
+        progress=reports.append,
+    )
+
+    assert result.passed
+    assert result.stopped is None
+    assert result.progress == reports[-1]
+    assert result.progress.rows == 6
+    assert result.progress.batches == 3
+    assert result.progress.fragments == 3
+    assert result.progress.checks == result.progress.total_checks == 1
+
+
+def test_validate_many_per_partition(tmp_path):
+    pyarrow.dataset.write_dataset(
+        pyarrow.table({"a": [1, 2, 1, 1, 3], "date": ["x", "x", "y", "y", "z"]}),
+        tmp_path,
+        format="parquet",
+        partitioning=["date"],
+        partitioning_flavor="hive",
+    )
+    dataset = pyarrow.dataset.dataset(tmp_path, partitioning="hive")
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.PerPartition(iudex.checks.Unique()),
+            ),
+            iudex.schema.Field("date", pyarrow.string()),
+        ],
+    )
+
+    (result,) = iudex.validate.validate_many(dataset, [schema])
+
+    assert result.failed_fields == ("a",)
+    assert result.failed_partitions == {"a": ('(date == "y")',)}
+
+    # Partitions are reported even if the field fails another check.
+    schema = iudex.schema.Schema(
+        [
+            iudex.schema.Field(
+                "a",
+                pyarrow.int64(),
+                check=iudex.checks.PerPartition(iudex.checks.Unique())
+                & iudex.checks.Greater(1),
+            ),
+            iudex.schema.Field("date", pyarrow.string()),
+        ],
+    )
+
+    (result,) = iudex.validate.validate_many(dataset, [schema])
+
+    assert result.failed_fields == ("a",)
+    assert result.failed_partitions == {"a": ('(date == "y")',)}
+
+
+@pytest.mark.parametrize("source", [None, "field", "metadata", "parquet"])
+def test_unique_uses_sortedness(tmp_path, monkeypatch, source):
+    fields = [iudex.schema.Field("a", pyarrow.int64(), check=iudex.checks.Unique())]
+    table = pyarrow.table({"a": [1, 2, 3, 3]})
+    if source is None:
+        data = table
+    elif source == "field":
+        fields = [dataclasses.replace(fields[0], sorted=True)]
+        data = table
+    elif source == "metadata":
+        sorted_schema = iudex.schema.Schema(
+            [iudex.schema.Field("a", pyarrow.int64(), sorted=True)]
+        )
+        data = table.cast(sorted_schema.to_pyarrow())
+    else:
+        pyarrow.parquet.write_table(
+            table,
+            tmp_path / "data.parquet",
+            sorting_columns=[pyarrow.parquet.SortingColumn(0)],
+        )
+        data = pyarrow.dataset.dataset(tmp_path / "data.parquet")
+    schema = iudex.schema.Schema(fields)
+    calls = []
+    unique_sorted = iudex.checks._unique_sorted
+
+    def spy(data, column):
+        calls.append(column)
+        return unique_sorted(data, column)
+
+    monkeypatch.setattr(iudex.checks, "_unique_sorted", spy)
+
+    (result,) = iudex.validate.validate_many(data, [schema])
+
+    assert result.failed_fields == ("a",)
+    assert calls == ([] if source is None else ["a"])
+
+
+def test_sortedness_read_once(tmp_path, monkeypatch):
+    table = pyarrow.table({"a": [1, 2, 3]})
+    pyarrow.parquet.write_table(table, tmp_path / "0.parquet")
+    pyarrow.parquet.write_table(
+        table,
+        tmp_path / "1.parquet",
+        sorting_columns=[pyarrow.parquet.SortingColumn(0)],
+    )
+    dataset = pyarrow.dataset.dataset(tmp_path)
+    calls = []
+    recorded_sorted = iudex.validate._recorded_sorted
+
+    def spy(source, name):
+        calls.append(name)
+        return recorded_sorted(source, name)
+
+    monkeypatch.setattr(iudex.validate, "_recorded_sorted", spy)
+    schemas = [
+        iudex.schema.Schema(
+            [iudex.schema.Field("a", pyarrow.int64(), check=check)],
+        )
+        for check in [iudex.checks.Unique(), iudex.checks.Unique(num_partitions=2)]
+    ]
+
+    results = iudex.validate.validate_many(dataset, schemas)
+
+    assert [result.failed_fields for result in results] == [("a",), ("a",)]
+    # Both schemas' checks share the footers read for the column.
+    assert calls == ["a"]
+    # Not every row group is sorted.
+    assert not recorded_sorted(dataset, "a")